@@ -15,11 +15,44 @@ Example
     print(f"Package version: {__version__}")
 """
 
-from importlib.metadata import version
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any
 
 from . import common, libs
 
-__version__ = version("ds-resource-plugin-py-lib")
+
+@cache
+def _read_version() -> str:
+    """
+    Read the installed package version from its distribution metadata.
+
+    Returns:
+        The package version, or ``"0.0.0"`` when the distribution is not installed.
+    """
+    try:
+        return version("ds-resource-plugin-py-lib")
+    except PackageNotFoundError:
+        return "0.0.0"
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve ``__version__`` lazily so the distribution metadata is only read on first access.
+
+    Args:
+        name: The attribute name.
+
+    Returns:
+        The attribute value.
+
+    Raises:
+        AttributeError: If the attribute does not exist.
+    """
+    if name == "__version__":
+        return _read_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "__version__",
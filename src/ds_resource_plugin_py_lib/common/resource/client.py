@@ -27,9 +27,10 @@ Example
     print(dataset.read())
 """
 
-from functools import lru_cache
+import sys
+from functools import cache, lru_cache
 from importlib import import_module
-from importlib.metadata import entry_points
+from importlib.metadata import EntryPoint, entry_points
 from pathlib import Path
 from typing import Any, cast
 
@@ -41,9 +42,47 @@ from ...libs.utils import import_string, sanitize_version
 from ..resource.dataset.base import Dataset, DatasetInfo
 from ..resource.linked_service.base import LinkedService, LinkedServiceInfo
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 logger = Logger.get_logger(__name__, package=True)
 
 
+def _intern(value: Any) -> Any:
+    """
+    Intern a key part read from resource.yaml so records of the same type and version share strings.
+
+    Non-string values, such as an unquoted ``version: 1.0`` parsed as a float, are returned unchanged.
+
+    Args:
+        value: The parsed YAML value.
+
+    Returns:
+        The interned string, or the value itself.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@cache
+def _discover_entry_points(group: str) -> tuple[EntryPoint, ...]:
+    """
+    Read the installed entry points for a group, once per process.
+
+    `importlib.metadata.entry_points` rescans every installed distribution on
+    each call; call `_discover_entry_points.cache_clear()` to pick up packages
+    installed after the first lookup.
+
+    Args:
+        group: The entry point group name.
+
+    Returns:
+        The entry points registered for the group.
+    """
+    return tuple(entry_points(group=group))
+
+
 class ResourceClient:
     PROTOCOL_GROUP = "ds.protocols"
     PROVIDER_GROUP = "ds.providers"
@@ -53,6 +92,7 @@ class ResourceClient:
         self._resource_dict: dict[str, dict[str, Any]] = {}
         self._linked_services: dict[tuple[str, str], LinkedServiceInfo] = {}
         self._datasets: dict[tuple[str, str], DatasetInfo] = {}
+        self._scanned_dirs: set[str] = set()
         self._discover_resources(self.PROTOCOL_GROUP)
         self._discover_resources(self.PROVIDER_GROUP)
         logger.debug(f"Loaded {len(self._resource_dict)} resources")
@@ -81,9 +121,10 @@ class ResourceClient:
         """
         Discover protocol/provider packages via entry points.
         Each entry point must target a Python package that contains resource.yaml in its root.
+        A package registered under both groups is scanned only once.
         """
         try:
-            eps = entry_points(group=group)
+            eps = _discover_entry_points(group)
         except Exception as exc:
             logger.warning(f"Failed to read entry points for {group}: {exc}")
             return
@@ -97,6 +138,9 @@ class ResourceClient:
                     continue
 
                 real_path = str(Path(module_path).parent.resolve())
+                if real_path in self._scanned_dirs:
+                    continue
+                self._scanned_dirs.add(real_path)
                 self._scan_resource_directory(real_path)
 
             except Exception as exc:
@@ -130,16 +174,18 @@ class ResourceClient:
             return
 
         try:
-            with Path(resource_yaml).open() as f:
-                resource_config = yaml.safe_load(f)
-                if not resource_config:
-                    logger.warning(f"Empty resource configuration in {resource_yaml}")
-                    return
-
-                resource_name = resource_config.get("name", resource_dir.name)
-                self._resource_dict[resource_name] = resource_config
-                self._parse_linked_services(resource_config)
-                self._parse_datasets(resource_config)
+            content = resource_yaml.read_bytes()
+            # Blank files never reach the YAML parser.
+            # _YamlLoader is CSafeLoader, or SafeLoader when LibYAML is unavailable.
+            resource_config = yaml.load(content, Loader=_YamlLoader) if content.strip() else None  # nosec B506
+            if not resource_config:
+                logger.warning(f"Empty resource configuration in {resource_yaml}")
+                return
+
+            resource_name = resource_config.get("name", resource_dir.name)
+            self._resource_dict[resource_name] = resource_config
+            self._parse_linked_services(resource_config)
+            self._parse_datasets(resource_config)
         except Exception as exc:
             logger.error(f"Error loading resource configuration from {resource_yaml}: {exc}")
 
@@ -154,8 +200,8 @@ class ResourceClient:
         for service in linked_services:
             service_name = service.get("name")
             if service_name:
-                type = service.get("type")
-                version = service.get("version", "1.0.0")
+                type = _intern(service.get("type"))
+                version = _intern(service.get("version", "1.0.0"))
                 service_info = LinkedServiceInfo(
                     type=type,
                     name=service_name,
@@ -177,8 +223,8 @@ class ResourceClient:
         for dataset in datasets:
             dataset_name = dataset.get("name")
             if dataset_name:
-                type = dataset.get("type")
-                version = dataset.get("version", "1.0.0")
+                type = _intern(dataset.get("type"))
+                version = _intern(dataset.get("version", "1.0.0"))
                 dataset_info = DatasetInfo(
                     type=type,
                     name=dataset_name,
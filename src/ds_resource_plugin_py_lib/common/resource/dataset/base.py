@@ -7,13 +7,12 @@ Description
 Base dataset models and typed properties.
 """
 
-import io
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import StrEnum
 from types import TracebackType
-from typing import Any, Generic, NamedTuple, Self, TypeVar
+from typing import Any, ClassVar, Generic, NamedTuple, Self, TypeVar
 
 import pandas as pd
 from ds_common_serde_py_lib import Serializable
@@ -21,10 +20,14 @@ from ds_common_serde_py_lib import Serializable
 from ...resource.linked_service.base import LinkedService
 from ...serde.deserialize.base import DataDeserializer
 from ...serde.serialize.base import DataSerializer
+from .buffers import _LazyBytesIO
 from .decorators import track_result
 from .enums import DatasetMethod
 from .result import OperationInfo
 
+_TRACKED_METHODS: tuple[str, ...] = tuple(m.value for m in DatasetMethod)
+_TRACKED_METHOD_NAMES: frozenset[str] = DatasetMethod.all_values()
+
 
 class DatasetInfo(NamedTuple):
     """
@@ -72,7 +75,7 @@ SerializerType = TypeVar("SerializerType", bound=DataSerializer)
 DeserializerType = TypeVar("DeserializerType", bound=DataDeserializer)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, eq=False, repr=False)
 class Dataset(
     ABC,
     Serializable,
@@ -102,10 +105,16 @@ class Dataset(
     checkpoint: dict[str, Any] = field(default_factory=dict)
     operation: OperationInfo = field(default_factory=OperationInfo)
 
+    _track_operations: ClassVar[bool] = True
+    """Set to ``False`` on a subclass to leave the methods it defines unwrapped by ``track_result``."""
+
     def __init_subclass__(cls, **kwargs: Any) -> None:
         """
         Initialize the subclass.
 
+        Wraps the dataset methods defined on the subclass with ``track_result``
+        unless the subclass sets ``_track_operations = False``.
+
         Args:
             kwargs: The keyword arguments.
 
@@ -113,7 +122,9 @@ class Dataset(
             The subclass.
         """
         super().__init_subclass__(**kwargs)
-        for name in DatasetMethod.all_values():
+        if not cls._track_operations or _TRACKED_METHOD_NAMES.isdisjoint(cls.__dict__):
+            return
+        for name in _TRACKED_METHODS:
             method = cls.__dict__.get(name)
             if method is not None and not getattr(method, "_tracked", False):
                 setattr(cls, name, track_result(method))
@@ -143,6 +154,15 @@ class Dataset(
         """
         self.close()
 
+    def __repr__(self) -> str:
+        """
+        Return a short representation of the dataset.
+
+        Returns:
+            The class name with the dataset name and version.
+        """
+        return f"{type(self).__name__}(name={self.name!r}, version={self.version!r})"
+
     @property
     def supports_checkpoint(self) -> bool:
         """Whether this provider supports incremental loads via ``self.checkpoint``."""
@@ -288,7 +308,7 @@ class Dataset(
         ...
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, eq=False, repr=False)
 class BinaryDataset(
     Dataset[LinkedServiceType, DatasetSettingsType, SerializerType, DeserializerType],
     Generic[LinkedServiceType, DatasetSettingsType, SerializerType, DeserializerType],
@@ -299,13 +319,16 @@ class BinaryDataset(
 
     The input of the dataset is a binary file.
     The output of the dataset is a binary file.
+
+    Both buffers are allocated lazily on first access, so providers that
+    assign their own file-like objects never pay for the empty defaults.
     """
 
-    input: io.BytesIO = field(default_factory=io.BytesIO, metadata={"serialize": False})
-    output: io.BytesIO = field(default_factory=io.BytesIO, metadata={"serialize": False})
+    input: _LazyBytesIO = field(default=_LazyBytesIO(), metadata={"serialize": False})
+    output: _LazyBytesIO = field(default=_LazyBytesIO(), metadata={"serialize": False})
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, eq=False, repr=False)
 class TabularDataset(
     Dataset[LinkedServiceType, DatasetSettingsType, SerializerType, DeserializerType],
     Generic[LinkedServiceType, DatasetSettingsType, SerializerType, DeserializerType],
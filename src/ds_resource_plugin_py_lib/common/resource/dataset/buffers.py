@@ -0,0 +1,57 @@
+"""
+**File:** ``buffers.py``
+**Region:** ``ds_resource_plugin_py_lib/common/resource/dataset``
+
+Description
+-----------
+Lazily allocated binary buffers for dataset input and output fields.
+"""
+
+import io
+from typing import Self, overload
+
+
+class _LazyBytesIO:
+    """
+    Descriptor that allocates an empty ``io.BytesIO`` on first read.
+
+    Used as the dataclass default, so ``__init__`` assigning the descriptor
+    itself leaves the buffer unallocated; any other value, including
+    ``None``, is stored and returned as-is.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = f"_{name}"
+
+    @overload
+    def __get__(self, obj: None, objtype: type | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, obj: object, objtype: type | None = None) -> io.BytesIO: ...
+
+    def __get__(self, obj: object | None, objtype: type | None = None) -> "Self | io.BytesIO":
+        if obj is None:
+            return self
+        try:
+            value: io.BytesIO = obj.__dict__[self._attr]
+        except KeyError:
+            value = obj.__dict__[self._attr] = io.BytesIO()
+        return value
+
+    def peek(self, obj: object) -> io.BytesIO | None:
+        """
+        Return the buffer stored on ``obj`` without allocating one.
+
+        Args:
+            obj: The instance owning the buffer.
+
+        Returns:
+            The stored value, or ``None`` when the buffer was never allocated.
+        """
+        value: io.BytesIO | None = obj.__dict__.get(self._attr)
+        return value
+
+    def __set__(self, obj: object, value: "io.BytesIO | _LazyBytesIO | None") -> None:
+        if value is self:
+            return
+        obj.__dict__[self._attr] = value
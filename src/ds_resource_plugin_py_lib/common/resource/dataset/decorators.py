@@ -9,13 +9,21 @@ Decorators applied automatically to dataset method overrides via
 """
 
 import functools
+import time
 from collections.abc import Callable
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from .enums import DatasetMethod
+import pandas as pd
+from ds_common_serde_py_lib.errors import SerdeError
+
+from ..errors import ResourceException
+from .buffers import _LazyBytesIO
+from .enums import _BY_VALUE
 from .result import OperationError, OperationInfo
 
+_STRUCTURED_ERRORS = (ResourceException, SerdeError)
+
 
 def track_result(fn: Callable[..., Any]) -> Callable[..., Any]:
     """
@@ -27,47 +35,68 @@ def track_result(fn: Callable[..., Any]) -> Callable[..., Any]:
     - ``method`` -- set to the function name.
     - ``success`` -- ``True`` when the method returns without raising.
     - ``error`` -- structured ``OperationError`` captured from
-      ``ResourceException`` on failure.
-    - ``started_at`` / ``ended_at`` / ``duration_ms`` -- wall-clock timing.
-    - ``row_count`` -- derived from ``len(self.output)`` when the
-      provider leaves the default (``0``).
-    - ``schema`` -- derived via PyArrow dtype inference on ``self.output``.
+      ``ResourceException`` or ``SerdeError`` on failure; other exceptions
+      map to their message, class name and status ``500``.
+    - ``started_at`` / ``ended_at`` / ``duration_ms`` -- timing; the duration
+      is measured with ``time.perf_counter_ns`` and ``ended_at`` is derived
+      from ``started_at`` plus that duration.
+    - ``row_count`` -- derived from the row dimension of a ``pd.DataFrame``
+      ``self.output`` when the provider leaves the default (``0``).
+    - ``schema`` -- derived from the ``pd.DataFrame`` dtypes when rows were
+      produced and the provider leaves the default (``None``).
 
     Providers may override any of these by assigning to ``self.operation``
     inside their method body.
 
+    Raises:
+        ValueError: If ``fn`` is not named after a ``DatasetMethod``.
     """
+    method = _BY_VALUE.get(fn.__name__)
+    if method is None:
+        raise ValueError(f"{fn.__name__!r} is not a valid DatasetMethod")
 
     @functools.wraps(fn)
     def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
-        self.operation = OperationInfo(method=DatasetMethod(fn.__name__))
+        self.operation = OperationInfo(method=method)
         self.operation.started_at = datetime.now(tz=UTC)
+        start_ns = time.perf_counter_ns()
         try:
             fn(self, *args, **kwargs)
 
             self.operation.success = True
 
-            if self.operation.row_count == 0 and hasattr(self.output, "__len__"):
-                self.operation.row_count = len(self.output)
+            # Peek at lazily allocated buffers (``BinaryDataset``) so tracking
+            # does not allocate one on every call.
+            output_field = getattr(type(self), "output", None)
+            output = output_field.peek(self) if isinstance(output_field, _LazyBytesIO) else self.output
+            if isinstance(output, pd.DataFrame):
+                if self.operation.row_count == 0:
+                    self.operation.row_count = output.shape[0]
 
-            if self.operation.schema is None and hasattr(self.output, "convert_dtypes"):
-                converted = self.output.convert_dtypes(dtype_backend="pyarrow")
-                self.operation.schema = {str(col): str(dtype) for col, dtype in converted.dtypes.to_dict().items()}
+                if self.operation.schema is None and self.operation.row_count > 0:
+                    self.operation.schema = dict(zip(map(str, output.columns), map(str, output.dtypes.values), strict=True))
 
         except Exception as exc:
             self.operation.success = False
-            self.operation.error = OperationError(
-                message=getattr(exc, "message", str(exc)),
-                code=getattr(exc, "code", type(exc).__name__),
-                status_code=getattr(exc, "status_code", 500),
-                details=getattr(exc, "details", {}),
-            )
+            if isinstance(exc, _STRUCTURED_ERRORS):
+                self.operation.error = OperationError(
+                    message=exc.message,
+                    code=exc.code,
+                    status_code=exc.status_code,
+                    details=exc.details,
+                )
+            else:
+                self.operation.error = OperationError(
+                    message=str(exc),
+                    code=type(exc).__name__,
+                    status_code=500,
+                )
             raise
 
         finally:
-            self.operation.ended_at = datetime.now(tz=UTC)
-            delta = self.operation.ended_at - self.operation.started_at
-            self.operation.duration_ms = round(delta.total_seconds() * 1000, 3)
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            self.operation.duration_ms = round(elapsed_ns / 1_000_000, 3)
+            self.operation.ended_at = self.operation.started_at + timedelta(microseconds=elapsed_ns // 1_000)
 
     wrapper._tracked = True  # type: ignore[attr-defined]
     return wrapper
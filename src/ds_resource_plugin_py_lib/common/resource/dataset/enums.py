@@ -33,4 +33,8 @@ class DatasetMethod(StrEnum):
     @staticmethod
     def all_values() -> frozenset[str]:
         """Return all operation method values as a frozen set."""
-        return frozenset(m.value for m in DatasetMethod)
+        return _ALL_VALUES
+
+
+_BY_VALUE: dict[str, DatasetMethod] = {m.value: m for m in DatasetMethod}
+_ALL_VALUES: frozenset[str] = frozenset(_BY_VALUE)
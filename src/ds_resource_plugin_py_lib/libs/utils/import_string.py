@@ -17,6 +17,7 @@ Example
     result = json_loads('{"a": 1}')
 """
 
+from functools import lru_cache
 from importlib import import_module
 from typing import Any
 
@@ -25,9 +26,14 @@ from ds_common_logger_py_lib import Logger
 logger = Logger.get_logger(__name__, package=True)
 
 
+@lru_cache(maxsize=256)
 def import_string(dotted_path: str) -> Any:
     """
     Import a dotted module path and return the attribute/class designated by the last name in the path.
+
+    Successful lookups are memoised per path; failures are not cached. Call
+    `import_string.cache_clear()` after reloading a module to drop stale results.
+
     Args:
         dotted_path: The dotted module path to import.
 
@@ -37,10 +43,9 @@ def import_string(dotted_path: str) -> Any:
     Raise ImportError if the import failed.
     """
     logger.debug("Importing string: %s", dotted_path)
-    try:
-        module_path, class_name = dotted_path.rsplit(".", 1)
-    except ValueError as exc:
-        raise ImportError(f"{dotted_path} doesn't look like a module path") from exc
+    module_path, _, class_name = dotted_path.rpartition(".")
+    if not module_path:
+        raise ImportError(f"{dotted_path} doesn't look like a module path")
 
     module = import_module(module_path)
 
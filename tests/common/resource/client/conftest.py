@@ -0,0 +1,136 @@
+"""
+**File:** ``conftest.py``
+**Region:** ``tests/common/resource/client``
+
+Description
+-----------
+Shared helpers and fixtures for `ResourceClient` tests.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from ds_resource_plugin_py_lib.common.resource import client as client_module
+from ds_resource_plugin_py_lib.common.resource.client import ResourceClient
+from tests.helpers import GRAPHQL_RESOURCE_TEXT, HTTP_RESOURCE_TEXT
+
+
+def _clear_client_caches() -> None:
+    """Clear the process-wide caches used by `ResourceClient` discovery."""
+    ResourceClient.get_instance.cache_clear()
+    client_module._discover_entry_points.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_client_caches() -> Iterator[None]:
+    """Keep the cached singleton and entry point lookups from leaking between tests."""
+    _clear_client_caches()
+    yield
+    _clear_client_caches()
+
+
+@pytest.fixture(scope="session")
+def graphql_resource_bytes() -> bytes:
+    """GraphQL resource.yaml content as raw bytes."""
+    return GRAPHQL_RESOURCE_TEXT.encode()
+
+
+@pytest.fixture(scope="session")
+def http_resource_bytes() -> bytes:
+    """HTTP resource.yaml content as raw bytes."""
+    return HTTP_RESOURCE_TEXT.encode()
+
+
+@pytest.fixture(scope="session")
+def graphql_resource_dir(tmp_path_factory: pytest.TempPathFactory, graphql_resource_bytes: bytes) -> Path:
+    """Read-only directory holding the GraphQL resource.yaml, created once per session."""
+    resource_dir = tmp_path_factory.mktemp("graphql_resource")
+    (resource_dir / "resource.yaml").write_bytes(graphql_resource_bytes)
+    return resource_dir
+
+
+@pytest.fixture(scope="session")
+def http_resource_dir(tmp_path_factory: pytest.TempPathFactory, http_resource_bytes: bytes) -> Path:
+    """Read-only directory holding the HTTP resource.yaml, created once per session."""
+    resource_dir = tmp_path_factory.mktemp("http_resource")
+    (resource_dir / "resource.yaml").write_bytes(http_resource_bytes)
+    return resource_dir
+
+
+@pytest.fixture
+def graphql_resource_file(temp_dir: Path, graphql_resource_bytes: bytes) -> Path:
+    """Write the GraphQL resource.yaml into the temporary directory."""
+    resource_file = temp_dir / "resource.yaml"
+    resource_file.write_bytes(graphql_resource_bytes)
+    return resource_file
+
+
+@pytest.fixture
+def mock_graphql_ep() -> SimpleNamespace:
+    """Entry point stand-in for the GraphQL protocol package."""
+    return SimpleNamespace(name="graphql", module="ds_protocol_graphql_py_lib")
+
+
+@pytest.fixture
+def patched_entry_points(monkeypatch: pytest.MonkeyPatch, mock_graphql_ep: SimpleNamespace) -> SimpleNamespace:
+    """Make `ResourceClient` discover only the GraphQL entry point."""
+    monkeypatch.setattr(
+        client_module,
+        "entry_points",
+        lambda *args, **kwargs: [mock_graphql_ep],
+    )
+    return mock_graphql_ep
+
+
+@pytest.fixture
+def no_entry_points(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make `ResourceClient` discover no entry points."""
+    monkeypatch.setattr(client_module, "entry_points", lambda *args, **kwargs: [])
+
+
+def _build_client(resource_dir: Path, ep: SimpleNamespace) -> ResourceClient:
+    """
+    Build a `ResourceClient` that discovers a single entry point rooted at `resource_dir`.
+
+    Args:
+        resource_dir: Directory holding the entry point's resource.yaml.
+        ep: The entry point stand-in to discover.
+
+    Returns:
+        The constructed client.
+    """
+    module = SimpleNamespace(__file__=str(resource_dir / "__init__.py"))
+    _clear_client_caches()
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(client_module, "entry_points", lambda *args, **kwargs: [ep])
+            mp.setattr(client_module, "import_module", lambda *args, **kwargs: module)
+            return ResourceClient()
+    finally:
+        _clear_client_caches()
+
+
+@pytest.fixture(scope="module")
+def warm_graphql_client(graphql_resource_dir: Path) -> ResourceClient:
+    """`ResourceClient` built once per module from the GraphQL resource directory, for read-only tests."""
+    return _build_client(graphql_resource_dir, SimpleNamespace(name="graphql", module="ds_protocol_graphql_py_lib"))
+
+
+@pytest.fixture(scope="module")
+def warm_http_client(http_resource_dir: Path) -> ResourceClient:
+    """`ResourceClient` built once per module from the HTTP resource directory, for read-only tests."""
+    return _build_client(http_resource_dir, SimpleNamespace(name="http", module="ds_protocol_http_py_lib"))
+
+
+@pytest.fixture
+def empty_client() -> ResourceClient:
+    """`ResourceClient` with no discovered resources, created without running entry point discovery."""
+    client = object.__new__(ResourceClient)
+    client._resource_dict = {}
+    client._linked_services = {}
+    client._datasets = {}
+    client._scanned_dirs = set()
+    return client
@@ -7,33 +7,28 @@ Description
 Test resource discovery via entry points.
 """
 
-from unittest.mock import Mock, patch
-
-import yaml
+from types import SimpleNamespace
 
+from ds_resource_plugin_py_lib.common.resource import client as client_module
 from ds_resource_plugin_py_lib.common.resource.client import ResourceClient
 
 
 class TestResourceDiscovery:
     """Test resource discovery via entry points."""
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_discover_protocols(self, mock_import_module, mock_entry_points, temp_dir, graphql_resource_yaml):
+    def test_discover_protocols(self, monkeypatch, temp_dir, graphql_resource_file):
         """Test discovery of resources from ds.protocols entry point group."""
         # Setup
-        ep = Mock()
-        ep.name = "graphql"
-        ep.module = "ds_protocol_graphql_py_lib"
-        mock_entry_points.return_value = [ep]
+        ep = SimpleNamespace(name="graphql", module="ds_protocol_graphql_py_lib")
+        groups = []
 
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
+        def fake_entry_points(group):
+            groups.append(group)
+            return [ep]
 
-        resource_file = temp_dir / "resource.yaml"
-        with resource_file.open("w") as f:
-            yaml.dump(graphql_resource_yaml, f)
+        module = SimpleNamespace(__file__=str(temp_dir / "__init__.py"))
+        monkeypatch.setattr(client_module, "entry_points", fake_entry_points)
+        monkeypatch.setattr(client_module, "import_module", lambda name: module)
 
         # Execute
         client = ResourceClient()
@@ -41,76 +36,61 @@ class TestResourceDiscovery:
         # Assert
         assert "graphql" in client.resources
         assert len(client.resources) == 1
-        mock_entry_points.assert_any_call(group="ds.protocols")
+        assert "ds.protocols" in groups
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_discover_providers(self, mock_import_module, mock_entry_points, temp_dir, graphql_resource_yaml):
+    def test_discover_providers(self, monkeypatch, temp_dir, graphql_resource_file):
         """Test discovery of resources from ds.providers entry point group."""
         # Setup
-        ep = Mock()
-        ep.name = "graphql"
-        ep.module = "ds_protocol_graphql_py_lib"
-        mock_entry_points.return_value = [ep]
+        ep = SimpleNamespace(name="graphql", module="ds_protocol_graphql_py_lib")
+        groups = []
 
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
+        def fake_entry_points(group):
+            groups.append(group)
+            return [ep]
 
-        resource_file = temp_dir / "resource.yaml"
-        with resource_file.open("w") as f:
-            yaml.dump(graphql_resource_yaml, f)
+        module = SimpleNamespace(__file__=str(temp_dir / "__init__.py"))
+        monkeypatch.setattr(client_module, "entry_points", fake_entry_points)
+        monkeypatch.setattr(client_module, "import_module", lambda name: module)
 
         # Execute
         client = ResourceClient()
 
         # Assert
         assert "graphql" in client.resources
-        mock_entry_points.assert_any_call(group="ds.providers")
+        assert "ds.providers" in groups
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_discover_both_groups(
-        self, mock_import_module, mock_entry_points, temp_dir, graphql_resource_yaml, http_resource_yaml
-    ):
+    def test_discover_both_groups(self, monkeypatch, temp_dir, graphql_resource_bytes, http_resource_bytes):
         """Test that both protocol and provider groups are discovered."""
         # Setup
-        protocol_ep = Mock()
-        protocol_ep.name = "graphql"
-        protocol_ep.module = "ds_protocol_graphql_py_lib"
+        protocol_ep = SimpleNamespace(name="graphql", module="ds_protocol_graphql_py_lib")
 
-        provider_ep = Mock()
-        provider_ep.name = "http"
-        provider_ep.module = "ds_protocol_http_py_lib"
+        provider_ep = SimpleNamespace(name="http", module="ds_protocol_http_py_lib")
 
-        def entry_points_side_effect(group):
+        def fake_entry_points(group):
             if group == "ds.protocols":
                 return [protocol_ep]
             elif group == "ds.providers":
                 return [provider_ep]
             return []
 
-        mock_entry_points.side_effect = entry_points_side_effect
-
         protocol_dir = temp_dir / "graphql"
         protocol_dir.mkdir()
         http_dir = temp_dir / "http"
         http_dir.mkdir()
 
-        def import_module_side_effect(module_name):
-            module = Mock()
+        def fake_import_module(module_name):
+            module = SimpleNamespace()
             if module_name == "ds_protocol_graphql_py_lib":
                 module.__file__ = str(protocol_dir / "__init__.py")
             elif module_name == "ds_protocol_http_py_lib":
                 module.__file__ = str(http_dir / "__init__.py")
             return module
 
-        mock_import_module.side_effect = import_module_side_effect
+        monkeypatch.setattr(client_module, "entry_points", fake_entry_points)
+        monkeypatch.setattr(client_module, "import_module", fake_import_module)
 
-        with (protocol_dir / "resource.yaml").open("w") as f:
-            yaml.dump(graphql_resource_yaml, f)
-        with (http_dir / "resource.yaml").open("w") as f:
-            yaml.dump(http_resource_yaml, f)
+        (protocol_dir / "resource.yaml").write_bytes(graphql_resource_bytes)
+        (http_dir / "resource.yaml").write_bytes(http_resource_bytes)
 
         # Execute
         client = ResourceClient()
@@ -120,11 +100,14 @@ class TestResourceDiscovery:
         assert "http" in client.resources
         assert len(client.resources) == 2
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    def test_entry_points_exception(self, mock_entry_points):
+    def test_entry_points_exception(self, monkeypatch):
         """Test graceful handling when entry_points() raises exception."""
+
         # Setup
-        mock_entry_points.side_effect = Exception("Entry point error")
+        def fake_entry_points(group):
+            raise Exception("Entry point error")
+
+        monkeypatch.setattr(client_module, "entry_points", fake_entry_points)
 
         # Execute
         client = ResourceClient()
@@ -132,19 +115,13 @@ class TestResourceDiscovery:
         # Assert
         assert len(client.resources) == 0
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_entry_point_no_file(self, mock_import_module, mock_entry_points):
+    def test_entry_point_no_file(self, monkeypatch):
         """Test handling of entry points without __file__ attribute."""
         # Setup
-        ep = Mock()
-        ep.name = "test"
-        ep.module = "test_module"
-        mock_entry_points.return_value = [ep]
-
-        module = Mock()
-        module.__file__ = None
-        mock_import_module.return_value = module
+        ep = SimpleNamespace(name="test", module="test_module")
+        module = SimpleNamespace(__file__=None)
+        monkeypatch.setattr(client_module, "entry_points", lambda group: [ep])
+        monkeypatch.setattr(client_module, "import_module", lambda name: module)
 
         # Execute
         client = ResourceClient()
@@ -152,20 +129,61 @@ class TestResourceDiscovery:
         # Assert
         assert len(client.resources) == 0
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_entry_point_import_error(self, mock_import_module, mock_entry_points):
+    def test_entry_point_import_error(self, monkeypatch):
         """Test handling of import errors for entry point modules."""
         # Setup
-        ep = Mock()
-        ep.name = "test"
-        ep.module = "test_module"
-        mock_entry_points.return_value = [ep]
+        ep = SimpleNamespace(name="test", module="test_module")
+
+        def fake_import_module(name):
+            raise ImportError("Cannot import module")
 
-        mock_import_module.side_effect = ImportError("Cannot import module")
+        monkeypatch.setattr(client_module, "entry_points", lambda group: [ep])
+        monkeypatch.setattr(client_module, "import_module", fake_import_module)
 
         # Execute
         client = ResourceClient()
 
         # Assert
         assert len(client.resources) == 0
+
+    def test_entry_points_read_once_per_group(self, monkeypatch):
+        """Test that entry points are read once per group and reused by later clients."""
+        # Setup
+        groups = []
+
+        def fake_entry_points(group):
+            groups.append(group)
+            return []
+
+        monkeypatch.setattr(client_module, "entry_points", fake_entry_points)
+
+        # Execute
+        ResourceClient()
+        ResourceClient()
+
+        # Assert
+        assert groups == ["ds.protocols", "ds.providers"]
+
+    def test_shared_package_directory_scanned_once(self, monkeypatch, temp_dir, graphql_resource_file):
+        """Test that a package listed under both groups has its resource.yaml parsed only once."""
+        # Setup
+        ep = SimpleNamespace(name="graphql", module="ds_protocol_graphql_py_lib")
+        module = SimpleNamespace(__file__=str(temp_dir / "__init__.py"))
+        monkeypatch.setattr(client_module, "entry_points", lambda group: [ep])
+        monkeypatch.setattr(client_module, "import_module", lambda name: module)
+
+        parsed = []
+        real_load = client_module.yaml.load
+
+        def recording_load(*args, **kwargs):
+            parsed.append(args)
+            return real_load(*args, **kwargs)
+
+        monkeypatch.setattr(client_module.yaml, "load", recording_load)
+
+        # Execute
+        client = ResourceClient()
+
+        # Assert
+        assert "graphql" in client.resources
+        assert len(parsed) == 1
@@ -7,244 +7,116 @@ Description
 Test instance creation from config dictionaries.
 """
 
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from typing import Any, NamedTuple
 
 import pytest
-import yaml
 from ds_common_serde_py_lib.errors import DeserializationError
 
+from ds_resource_plugin_py_lib.common.resource import client as client_module
 from ds_resource_plugin_py_lib.common.resource.client import ResourceClient
 
 
-class TestInstanceCreation:
-    """Test instance creation from config dictionaries."""
-
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_string")
-    def test_linked_service_creation(
-        self,
-        mock_import_string,
-        mock_import_module,
-        mock_entry_points,
-        temp_dir,
-        graphql_resource_yaml,
-        mock_linked_service_class,
-    ):
-        """Test creating linked service instance from config dict."""
-        # Setup
-        ep = Mock()
-        ep.name = "graphql"
-        ep.module = "ds_protocol_graphql_py_lib"
-        mock_entry_points.return_value = [ep]
-
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
-
-        resource_file = temp_dir / "resource.yaml"
-        with resource_file.open("w") as f:
-            yaml.dump(graphql_resource_yaml, f)
+class _ResourceKind(NamedTuple):
+    """One resource kind exercised by the creation tests."""
+
+    method_name: str
+    resource_type: str
+    err_frag: str
+    mock_cls_fixture: str
+    settings: dict[str, Any]
+
+
+RESOURCE_KINDS = pytest.mark.parametrize(
+    "kind",
+    [
+        _ResourceKind(
+            method_name="linked_service",
+            resource_type="DS.RESOURCE.LINKED_SERVICE.GRAPHQL",
+            err_frag="linked service",
+            mock_cls_fixture="mock_linked_service_class",
+            settings={"url": "https://example.com/graphql"},
+        ),
+        _ResourceKind(
+            method_name="dataset",
+            resource_type="DS.RESOURCE.DATASET.GRAPHQL",
+            err_frag="dataset",
+            mock_cls_fixture="mock_dataset_class",
+            settings={"query": "query { users { id } }"},
+        ),
+    ],
+    ids=["linked_service", "dataset"],
+)
 
-        mock_import_string.return_value = mock_linked_service_class
 
-        client = ResourceClient()
-
-        config = {
-            "type": "DS.RESOURCE.LINKED_SERVICE.GRAPHQL",
-            "version": "1.0.0",
-            "settings": {"url": "https://example.com/graphql"},
-        }
-
-        # Execute
-        linked_service = client.linked_service(config)
+class TestInstanceCreation:
+    """Test instance creation from config dictionaries."""
 
-        # Assert
-        assert linked_service is not None
-        mock_linked_service_class.deserialize.assert_called_once_with(config)
-
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_string")
-    def test_dataset_creation(
-        self,
-        mock_import_string,
-        mock_import_module,
-        mock_entry_points,
-        temp_dir,
-        graphql_resource_yaml,
-        mock_dataset_class,
-    ):
-        """Test creating dataset instance from config dict."""
+    @RESOURCE_KINDS
+    @pytest.mark.usefixtures("patched_entry_points", "graphql_resource_file")
+    def test_creation(self, monkeypatch, request, temp_dir, kind):
+        """Test creating a linked service or dataset instance from config dict."""
         # Setup
-        ep = Mock()
-        ep.name = "graphql"
-        ep.module = "ds_protocol_graphql_py_lib"
-        mock_entry_points.return_value = [ep]
-
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
-
-        resource_file = temp_dir / "resource.yaml"
-        with resource_file.open("w") as f:
-            yaml.dump(graphql_resource_yaml, f)
+        module = SimpleNamespace(__file__=str(temp_dir / "__init__.py"))
+        monkeypatch.setattr(client_module, "import_module", lambda name: module)
 
-        mock_import_string.return_value = mock_dataset_class
+        mock_cls = request.getfixturevalue(kind.mock_cls_fixture)
+        monkeypatch.setattr(client_module, "import_string", lambda path: mock_cls)
 
         client = ResourceClient()
 
-        config = {
-            "type": "DS.RESOURCE.DATASET.GRAPHQL",
-            "version": "1.0.0",
-            "settings": {"query": "query { users { id } }"},
-        }
+        config = {"type": kind.resource_type, "version": "1.0.0", "settings": kind.settings}
 
         # Execute
-        dataset = client.dataset(config)
+        instance = getattr(client, kind.method_name)(config)
 
         # Assert
-        assert dataset is not None
-        mock_dataset_class.deserialize.assert_called_once_with(config)
-
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    def test_linked_service_missing_type(self, mock_entry_points):
-        """Test error handling when type is missing."""
-        # Setup
-        mock_entry_points.return_value = []
-        client = ResourceClient()
-
-        config = {"version": "1.0.0", "settings": {"url": "https://example.com"}}
-
-        # Execute & Assert
-        with pytest.raises(DeserializationError) as exc_info:
-            client.linked_service(config)
-        assert "type" in str(exc_info.value.details.get("error", ""))
+        assert instance is not None
+        assert instance is mock_cls.instance
+        assert mock_cls.calls == [config]
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    def test_dataset_missing_type(self, mock_entry_points):
+    @pytest.mark.parametrize("method_name", ["linked_service", "dataset"])
+    def test_missing_type(self, empty_client, method_name):
         """Test error handling when type is missing."""
         # Setup
-        mock_entry_points.return_value = []
-        client = ResourceClient()
-
-        config = {"version": "1.0.0", "settings": {"query": "query { users }"}}
+        config = {"version": "1.0.0", "settings": {}}
 
         # Execute & Assert
-        with pytest.raises(DeserializationError) as exc_info:
-            client.dataset(config)
-        assert "type" in str(exc_info.value.details.get("error", ""))
-
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    def test_linked_service_unknown_type(self, mock_entry_points):
+        with pytest.raises(DeserializationError, match=r"Error deserializing .*: 'type'"):
+            getattr(empty_client, method_name)(config)
+
+    @pytest.mark.parametrize(
+        ("method_name", "resource_type"),
+        [
+            ("linked_service", "DS.RESOURCE.LINKED_SERVICE.UNKNOWN"),
+            ("dataset", "DS.RESOURCE.DATASET.UNKNOWN"),
+        ],
+    )
+    def test_unknown_type(self, empty_client, method_name, resource_type):
         """Test error handling when type is not found."""
         # Setup
-        mock_entry_points.return_value = []
-        client = ResourceClient()
-
-        config = {"type": "DS.RESOURCE.LINKED_SERVICE.UNKNOWN", "version": "1.0.0"}
+        config = {"type": resource_type, "version": "1.0.0"}
 
         # Execute & Assert
         with pytest.raises(DeserializationError):
-            client.linked_service(config)
-
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    def test_dataset_unknown_type(self, mock_entry_points):
-        """Test error handling when type is not found."""
-        # Setup
-        mock_entry_points.return_value = []
-        client = ResourceClient()
-
-        config = {"type": "DS.RESOURCE.DATASET.UNKNOWN", "version": "1.0.0"}
+            getattr(empty_client, method_name)(config)
 
-        # Execute & Assert
-        with pytest.raises(DeserializationError):
-            client.dataset(config)
-
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_string")
-    def test_linked_service_deserialization_error(
-        self,
-        mock_import_string,
-        mock_import_module,
-        mock_entry_points,
-        temp_dir,
-        graphql_resource_yaml,
-        mock_linked_service_class,
-    ):
+    @RESOURCE_KINDS
+    @pytest.mark.usefixtures("patched_entry_points", "graphql_resource_file")
+    def test_deserialization_error(self, monkeypatch, request, temp_dir, kind):
         """Test DeserializationError on deserialize failure."""
         # Setup
-        ep = Mock()
-        ep.name = "graphql"
-        ep.module = "ds_protocol_graphql_py_lib"
-        mock_entry_points.return_value = [ep]
-
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
-
-        resource_file = temp_dir / "resource.yaml"
-        with resource_file.open("w") as f:
-            yaml.dump(graphql_resource_yaml, f)
+        module = SimpleNamespace(__file__=str(temp_dir / "__init__.py"))
+        monkeypatch.setattr(client_module, "import_module", lambda name: module)
 
-        mock_import_string.return_value = mock_linked_service_class
-        mock_linked_service_class.deserialize.side_effect = TypeError("Invalid config")
+        mock_cls = request.getfixturevalue(kind.mock_cls_fixture)
+        mock_cls.side_effect = TypeError("Invalid config")
+        monkeypatch.setattr(client_module, "import_string", lambda path: mock_cls)
 
         client = ResourceClient()
 
-        config = {
-            "type": "DS.RESOURCE.LINKED_SERVICE.GRAPHQL",
-            "version": "1.0.0",
-            "settings": {"invalid": "data"},
-        }
+        config = {"type": kind.resource_type, "version": "1.0.0", "settings": {"invalid": "data"}}
 
         # Execute & Assert
-        with pytest.raises(DeserializationError) as exc_info:
-            client.linked_service(config)
-
-        assert "Error deserializing linked service" in str(exc_info.value.message)
-
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_string")
-    def test_dataset_deserialization_error(
-        self,
-        mock_import_string,
-        mock_import_module,
-        mock_entry_points,
-        temp_dir,
-        graphql_resource_yaml,
-        mock_dataset_class,
-    ):
-        """Test DeserializationError on deserialize failure."""
-        # Setup
-        ep = Mock()
-        ep.name = "graphql"
-        ep.module = "ds_protocol_graphql_py_lib"
-        mock_entry_points.return_value = [ep]
-
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
-
-        resource_file = temp_dir / "resource.yaml"
-        with resource_file.open("w") as f:
-            yaml.dump(graphql_resource_yaml, f)
-
-        mock_import_string.return_value = mock_dataset_class
-        mock_dataset_class.deserialize.side_effect = TypeError("Invalid config")
-
-        client = ResourceClient()
-
-        config = {
-            "type": "DS.RESOURCE.DATASET.GRAPHQL",
-            "version": "1.0.0",
-            "settings": {"invalid": "data"},
-        }
-
-        # Execute & Assert
-        with pytest.raises(DeserializationError) as exc_info:
-            client.dataset(config)
-
-        assert "Error deserializing dataset" in str(exc_info.value.message)
+        with pytest.raises(DeserializationError, match=f"Error deserializing {kind.err_frag}: Invalid config"):
+            getattr(client, kind.method_name)(config)
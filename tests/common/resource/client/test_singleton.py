@@ -7,20 +7,17 @@ Description
 Test singleton pattern implementation.
 """
 
-from unittest.mock import patch
+import pytest
 
 from ds_resource_plugin_py_lib.common.resource.client import ResourceClient
 
 
+@pytest.mark.usefixtures("no_entry_points")
 class TestSingletonPattern:
     """Test singleton pattern implementation."""
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    def test_get_instance_singleton(self, mock_entry_points):
+    def test_get_instance_singleton(self):
         """Test that get_instance() returns the same instance (using lru_cache)."""
-        # Setup
-        mock_entry_points.return_value = []
-
         # Execute
         instance1 = ResourceClient.get_instance()
         instance2 = ResourceClient.get_instance()
@@ -28,12 +25,8 @@ class TestSingletonPattern:
         # Assert
         assert instance1 is instance2
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    def test_get_instance_cached(self, mock_entry_points):
+    def test_get_instance_cached(self):
         """Test that multiple calls return cached instance."""
-        # Setup
-        mock_entry_points.return_value = []
-
         # Execute
         instance1 = ResourceClient.get_instance()
         instance2 = ResourceClient.get_instance()
@@ -41,3 +34,8 @@ class TestSingletonPattern:
 
         # Assert
         assert instance1 is instance2 is instance3
+
+    def test_get_instance_not_shared_between_tests(self):
+        """Test that the singleton cache starts empty for every test."""
+        # Assert
+        assert ResourceClient.get_instance.cache_info().currsize == 0
@@ -7,12 +7,12 @@ Description
 Test version differentiation for datasets.
 """
 
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 
 import pytest
-import yaml
 from ds_common_serde_py_lib.errors import DeserializationError
 
+from ds_resource_plugin_py_lib.common.resource import client as client_module
 from ds_resource_plugin_py_lib.common.resource.client import ResourceClient
 from ds_resource_plugin_py_lib.common.resource.dataset.base import DatasetInfo
 
@@ -20,139 +20,46 @@ from ds_resource_plugin_py_lib.common.resource.dataset.base import DatasetInfo
 class TestVersionDifferentiation:
     """Test version differentiation for datasets."""
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_multiple_dataset_versions(self, mock_import_module, mock_entry_points, temp_dir, http_resource_yaml):
-        """Test parsing resource.yaml with multiple dataset versions (same type, different versions)."""
-        # Setup
-        ep = Mock()
-        ep.name = "http"
-        ep.module = "ds_protocol_http_py_lib"
-        mock_entry_points.return_value = [ep]
-
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
-
-        resource_file = temp_dir / "resource.yaml"
-        with resource_file.open("w") as f:
-            yaml.dump(http_resource_yaml, f)
-
-        # Execute
-        client = ResourceClient()
-
+    @pytest.mark.parametrize(
+        ("version", "expected_class_name", "forbidden_substr"),
+        [
+            ("1.0.0", "ds_protocol_http_py_lib.dataset.http.HttpDataset", "httpV2"),
+            ("2.0.0", "ds_protocol_http_py_lib.dataset.httpV2.HttpDataset", None),
+        ],
+    )
+    def test_dataset_versions_stored(self, warm_http_client, version, expected_class_name, forbidden_substr):
+        """Test that multiple versions of the same dataset type are stored under composite (type, version) keys."""
         # Assert
-        # Both versions should be stored with composite keys (type, version)
-        assert ("DS.RESOURCE.DATASET.HTTP", "1.0.0") in client.datasets
-        assert ("DS.RESOURCE.DATASET.HTTP", "2.0.0") in client.datasets
-
-        # Verify v1.0.0
-        dataset_info_v1 = client.datasets[("DS.RESOURCE.DATASET.HTTP", "1.0.0")]
-        assert dataset_info_v1.version == "1.0.0"
-        assert dataset_info_v1.class_name == "ds_protocol_http_py_lib.dataset.http.HttpDataset"
-
-        # Verify v2.0.0
-        dataset_info_v2 = client.datasets[("DS.RESOURCE.DATASET.HTTP", "2.0.0")]
-        assert dataset_info_v2.version == "2.0.0"
-        assert dataset_info_v2.class_name == "ds_protocol_http_py_lib.dataset.httpV2.HttpDataset"
-
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_version_in_dataset_info(self, mock_import_module, mock_entry_points, temp_dir, http_resource_yaml):
-        """Test that DatasetInfo correctly stores version information."""
-        # Setup
-        ep = Mock()
-        ep.name = "http"
-        ep.module = "ds_protocol_http_py_lib"
-        mock_entry_points.return_value = [ep]
-
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
+        assert ("DS.RESOURCE.DATASET.HTTP", version) in warm_http_client.datasets
 
-        resource_file = temp_dir / "resource.yaml"
-        with resource_file.open("w") as f:
-            yaml.dump(http_resource_yaml, f)
-
-        # Execute
-        client = ResourceClient()
+        dataset_info = warm_http_client.datasets[("DS.RESOURCE.DATASET.HTTP", version)]
+        assert isinstance(dataset_info, DatasetInfo)
+        assert dataset_info.version == version
+        assert dataset_info.class_name == expected_class_name
+        if forbidden_substr:
+            assert forbidden_substr not in dataset_info.class_name
 
-        # Assert
-        # Both versions should be stored
-        assert ("DS.RESOURCE.DATASET.HTTP", "1.0.0") in client.datasets
-        assert ("DS.RESOURCE.DATASET.HTTP", "2.0.0") in client.datasets
-
-        dataset_info_v1 = client.datasets[("DS.RESOURCE.DATASET.HTTP", "1.0.0")]
-        assert isinstance(dataset_info_v1, DatasetInfo)
-        assert dataset_info_v1.version == "1.0.0"
-
-        dataset_info_v2 = client.datasets[("DS.RESOURCE.DATASET.HTTP", "2.0.0")]
-        assert isinstance(dataset_info_v2, DatasetInfo)
-        assert dataset_info_v2.version == "2.0.0"
-
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_both_versions_stored(self, mock_import_module, mock_entry_points, temp_dir, http_resource_yaml):
-        """Test that when multiple versions share same type, both are stored with composite keys."""
-        # Setup
-        ep = Mock()
-        ep.name = "http"
-        ep.module = "ds_protocol_http_py_lib"
-        mock_entry_points.return_value = [ep]
-
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
-
-        resource_file = temp_dir / "resource.yaml"
-        with resource_file.open("w") as f:
-            yaml.dump(http_resource_yaml, f)
-
-        # Execute
-        client = ResourceClient()
-
-        # Assert
-        # Both versions should be stored separately
-        assert ("DS.RESOURCE.DATASET.HTTP", "1.0.0") in client.datasets
-        assert ("DS.RESOURCE.DATASET.HTTP", "2.0.0") in client.datasets
-
-        dataset_info_v1 = client.datasets[("DS.RESOURCE.DATASET.HTTP", "1.0.0")]
-        assert dataset_info_v1.version == "1.0.0"
-        assert "http" in dataset_info_v1.class_name
-        assert "httpV2" not in dataset_info_v1.class_name
-
-        dataset_info_v2 = client.datasets[("DS.RESOURCE.DATASET.HTTP", "2.0.0")]
-        assert dataset_info_v2.version == "2.0.0"
-        assert "httpV2" in dataset_info_v2.class_name
-
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_string")
     def test_dataset_version_selection_with_version(
         self,
-        mock_import_string,
-        mock_import_module,
-        mock_entry_points,
-        temp_dir,
-        http_resource_yaml,
+        monkeypatch,
+        http_resource_dir,
         mock_dataset_class,
     ):
         """Test creating dataset instance with specific version - should use that version."""
         # Setup
-        ep = Mock()
-        ep.name = "http"
-        ep.module = "ds_protocol_http_py_lib"
-        mock_entry_points.return_value = [ep]
+        ep = SimpleNamespace(name="http", module="ds_protocol_http_py_lib")
+        monkeypatch.setattr(client_module, "entry_points", lambda group: [ep])
 
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
+        module = SimpleNamespace(__file__=str(http_resource_dir / "__init__.py"))
+        monkeypatch.setattr(client_module, "import_module", lambda name: module)
 
-        resource_file = temp_dir / "resource.yaml"
-        with resource_file.open("w") as f:
-            yaml.dump(http_resource_yaml, f)
+        imported_paths = []
 
-        mock_import_string.return_value = mock_dataset_class
+        def fake_import_string(path):
+            imported_paths.append(path)
+            return mock_dataset_class
+
+        monkeypatch.setattr(client_module, "import_string", fake_import_string)
 
         client = ResourceClient()
 
@@ -169,32 +76,21 @@ class TestVersionDifferentiation:
         # Assert
         assert dataset is not None
         # Verify that import_string was called with v1 class name
-        mock_import_string.assert_called_with("ds_protocol_http_py_lib.dataset.http.HttpDataset")
-        mock_dataset_class.deserialize.assert_called_once_with(config)
+        assert imported_paths[-1] == "ds_protocol_http_py_lib.dataset.http.HttpDataset"
+        assert mock_dataset_class.calls == [config]
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
     def test_dataset_missing_version(
         self,
-        mock_import_module,
-        mock_entry_points,
-        temp_dir,
-        http_resource_yaml,
+        monkeypatch,
+        http_resource_dir,
     ):
         """Test error handling when version is missing from config."""
         # Setup
-        ep = Mock()
-        ep.name = "http"
-        ep.module = "ds_protocol_http_py_lib"
-        mock_entry_points.return_value = [ep]
-
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
+        ep = SimpleNamespace(name="http", module="ds_protocol_http_py_lib")
+        monkeypatch.setattr(client_module, "entry_points", lambda group: [ep])
 
-        resource_file = temp_dir / "resource.yaml"
-        with resource_file.open("w") as f:
-            yaml.dump(http_resource_yaml, f)
+        module = SimpleNamespace(__file__=str(http_resource_dir / "__init__.py"))
+        monkeypatch.setattr(client_module, "import_module", lambda name: module)
 
         client = ResourceClient()
         config = {
@@ -202,6 +98,5 @@ class TestVersionDifferentiation:
             "settings": {"url": "https://example.com"},
         }
 
-        with pytest.raises(DeserializationError) as exc_info:
+        with pytest.raises(DeserializationError, match="Error deserializing dataset: 'version'"):
             client.dataset(config)
-        assert "version" in str(exc_info.value.details.get("error", ""))
@@ -7,33 +7,21 @@ Description
 Test YAML parsing and resource loading.
 """
 
-from unittest.mock import Mock, patch
-
-import yaml
+import sys
+from types import SimpleNamespace
 
+from ds_resource_plugin_py_lib.common.resource import client as client_module
 from ds_resource_plugin_py_lib.common.resource.client import ResourceClient
 
 
 class TestYAMLParsing:
     """Test YAML parsing and resource loading."""
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_load_resource_yaml(self, mock_import_module, mock_entry_points, temp_dir, graphql_resource_yaml):
+    def test_load_resource_yaml(self, monkeypatch, temp_dir, patched_entry_points, graphql_resource_file, graphql_resource_yaml):
         """Test loading and parsing of valid resource.yaml files."""
         # Setup
-        ep = Mock()
-        ep.name = "graphql"
-        ep.module = "ds_protocol_graphql_py_lib"
-        mock_entry_points.return_value = [ep]
-
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
-
-        resource_file = temp_dir / "resource.yaml"
-        with resource_file.open("w") as f:
-            yaml.dump(graphql_resource_yaml, f)
+        module = SimpleNamespace(__file__=str(temp_dir / "__init__.py"))
+        monkeypatch.setattr(client_module, "import_module", lambda name: module)
 
         # Execute
         client = ResourceClient()
@@ -42,20 +30,43 @@ class TestYAMLParsing:
         assert "graphql" in client.resources
         assert client.resources["graphql"]["name"] == "graphql"
         assert client.resources["graphql"]["description"] == "GraphQL provider for the DS Business Workflow"
+        assert client.resources["graphql"] == graphql_resource_yaml
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_resource_yaml_missing(self, mock_import_module, mock_entry_points, temp_dir):
+    def test_unquoted_numeric_version_kept_alongside_valid_entries(self, monkeypatch, temp_dir):
+        """Test that a non-string version is registered as-is and does not drop the other entries."""
+        # Setup
+        ep = SimpleNamespace(name="test", module="test_module")
+        monkeypatch.setattr(client_module, "entry_points", lambda group: [ep])
+
+        module = SimpleNamespace(__file__=str(temp_dir / "__init__.py"))
+        monkeypatch.setattr(client_module, "import_module", lambda name: module)
+
+        (temp_dir / "resource.yaml").write_text(
+            "name: mixed\n"
+            "linked_service:\n"
+            "  - {name: A, type: ds.a, version: 1.0, class_name: m.A}\n"
+            "  - {name: B, type: ds.b, version: 2.0.0, class_name: m.B}\n"
+            "dataset:\n"
+            "  - {name: C, type: ds.c, version: 1.0, class_name: m.C}\n"
+            "  - {name: D, type: ds.d, version: 1.0.0, class_name: m.D}\n"
+        )
+
+        # Execute
+        client = ResourceClient()
+
+        # Assert
+        assert set(client.linked_services) == {("ds.a", 1.0), ("ds.b", "2.0.0")}
+        assert set(client.datasets) == {("ds.c", 1.0), ("ds.d", "1.0.0")}
+        assert client.datasets[("ds.d", "1.0.0")].type is sys.intern("ds.d")
+
+    def test_resource_yaml_missing(self, monkeypatch, temp_dir):
         """Test handling when resource.yaml doesn't exist."""
         # Setup
-        ep = Mock()
-        ep.name = "test"
-        ep.module = "test_module"
-        mock_entry_points.return_value = [ep]
+        ep = SimpleNamespace(name="test", module="test_module")
+        monkeypatch.setattr(client_module, "entry_points", lambda group: [ep])
 
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
+        module = SimpleNamespace(__file__=str(temp_dir / "__init__.py"))
+        monkeypatch.setattr(client_module, "import_module", lambda name: module)
 
         # Execute
         client = ResourceClient()
@@ -63,19 +74,14 @@ class TestYAMLParsing:
         # Assert
         assert len(client.resources) == 0
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_resource_yaml_empty(self, mock_import_module, mock_entry_points, temp_dir):
+    def test_resource_yaml_empty(self, monkeypatch, temp_dir):
         """Test handling of empty resource.yaml files."""
         # Setup
-        ep = Mock()
-        ep.name = "test"
-        ep.module = "test_module"
-        mock_entry_points.return_value = [ep]
+        ep = SimpleNamespace(name="test", module="test_module")
+        monkeypatch.setattr(client_module, "entry_points", lambda group: [ep])
 
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
+        module = SimpleNamespace(__file__=str(temp_dir / "__init__.py"))
+        monkeypatch.setattr(client_module, "import_module", lambda name: module)
 
         resource_file = temp_dir / "resource.yaml"
         resource_file.write_text("")
@@ -86,50 +92,50 @@ class TestYAMLParsing:
         # Assert
         assert len(client.resources) == 0
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_resource_yaml_invalid(self, mock_import_module, mock_entry_points, temp_dir):
-        """Test handling of invalid YAML syntax."""
+    def test_resource_yaml_blank_skips_parser(self, monkeypatch, temp_dir):
+        """Test that whitespace-only resource.yaml files are skipped without invoking the YAML parser."""
         # Setup
-        ep = Mock()
-        ep.name = "test"
-        ep.module = "test_module"
-        mock_entry_points.return_value = [ep]
+        ep = SimpleNamespace(name="test", module="test_module")
+        monkeypatch.setattr(client_module, "entry_points", lambda group: [ep])
 
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
+        module = SimpleNamespace(__file__=str(temp_dir / "__init__.py"))
+        monkeypatch.setattr(client_module, "import_module", lambda name: module)
 
-        resource_file = temp_dir / "resource.yaml"
-        resource_file.write_text("invalid: yaml: content: [unclosed")
+        parsed = []
+        monkeypatch.setattr(client_module.yaml, "load", lambda *args, **kwargs: parsed.append(args))
+
+        (temp_dir / "resource.yaml").write_text("\n  \n")
 
         # Execute
         client = ResourceClient()
 
         # Assert
         assert len(client.resources) == 0
+        assert parsed == []
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_parse_linked_services(self, mock_import_module, mock_entry_points, temp_dir, graphql_resource_yaml):
-        """Test parsing of linked services from resource config."""
+    def test_resource_yaml_invalid(self, monkeypatch, temp_dir):
+        """Test handling of invalid YAML syntax."""
         # Setup
-        ep = Mock()
-        ep.name = "graphql"
-        ep.module = "ds_protocol_graphql_py_lib"
-        mock_entry_points.return_value = [ep]
+        ep = SimpleNamespace(name="test", module="test_module")
+        monkeypatch.setattr(client_module, "entry_points", lambda group: [ep])
 
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
+        module = SimpleNamespace(__file__=str(temp_dir / "__init__.py"))
+        monkeypatch.setattr(client_module, "import_module", lambda name: module)
 
         resource_file = temp_dir / "resource.yaml"
-        with resource_file.open("w") as f:
-            yaml.dump(graphql_resource_yaml, f)
+        resource_file.write_text("invalid: yaml: content: [unclosed")
 
         # Execute
         client = ResourceClient()
 
+        # Assert
+        assert len(client.resources) == 0
+
+    def test_parse_linked_services(self, warm_graphql_client):
+        """Test parsing of linked services from resource config."""
+        # Setup
+        client = warm_graphql_client
+
         # Assert
         assert ("DS.RESOURCE.LINKED_SERVICE.GRAPHQL", "1.0.0") in client.linked_services
         linked_service = client.linked_services[("DS.RESOURCE.LINKED_SERVICE.GRAPHQL", "1.0.0")]
@@ -138,26 +144,10 @@ class TestYAMLParsing:
         assert linked_service.version == "1.0.0"
         assert linked_service.class_name == "ds_protocol_graphql_py_lib.linked_service.graphql.GraphQLLinkedService"
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_parse_datasets(self, mock_import_module, mock_entry_points, temp_dir, graphql_resource_yaml):
+    def test_parse_datasets(self, warm_graphql_client):
         """Test parsing of datasets from resource config."""
         # Setup
-        ep = Mock()
-        ep.name = "graphql"
-        ep.module = "ds_protocol_graphql_py_lib"
-        mock_entry_points.return_value = [ep]
-
-        module = Mock()
-        module.__file__ = str(temp_dir / "__init__.py")
-        mock_import_module.return_value = module
-
-        resource_file = temp_dir / "resource.yaml"
-        with resource_file.open("w") as f:
-            yaml.dump(graphql_resource_yaml, f)
-
-        # Execute
-        client = ResourceClient()
+        client = warm_graphql_client
 
         # Assert
         assert ("DS.RESOURCE.DATASET.GRAPHQL", "1.0.0") in client.datasets
@@ -167,20 +157,14 @@ class TestYAMLParsing:
         assert dataset.version == "1.0.0"
         assert dataset.class_name == "ds_protocol_graphql_py_lib.dataset.graphql.GraphQLDataset"
 
-    @patch("ds_resource_plugin_py_lib.common.resource.client.entry_points")
-    @patch("ds_resource_plugin_py_lib.common.resource.client.import_module")
-    def test_multiple_resources(self, mock_import_module, mock_entry_points, temp_dir, graphql_resource_yaml, http_resource_yaml):
+    def test_multiple_resources(self, monkeypatch, temp_dir, graphql_resource_bytes, http_resource_bytes):
         """Test discovery of multiple resources with same/different names."""
         # Setup
-        ep1 = Mock()
-        ep1.name = "graphql"
-        ep1.module = "ds_protocol_graphql_py_lib"
+        ep1 = SimpleNamespace(name="graphql", module="ds_protocol_graphql_py_lib")
 
-        ep2 = Mock()
-        ep2.name = "http"
-        ep2.module = "ds_protocol_http_py_lib"
+        ep2 = SimpleNamespace(name="http", module="ds_protocol_http_py_lib")
 
-        mock_entry_points.return_value = [ep1, ep2]
+        monkeypatch.setattr(client_module, "entry_points", lambda group: [ep1, ep2])
 
         graphql_dir = temp_dir / "graphql"
         graphql_dir.mkdir()
@@ -188,19 +172,17 @@ class TestYAMLParsing:
         http_dir.mkdir()
 
         def import_module_side_effect(module_name):
-            module = Mock()
+            module = SimpleNamespace()
             if module_name == "ds_protocol_graphql_py_lib":
                 module.__file__ = str(graphql_dir / "__init__.py")
             elif module_name == "ds_protocol_http_py_lib":
                 module.__file__ = str(http_dir / "__init__.py")
             return module
 
-        mock_import_module.side_effect = import_module_side_effect
+        monkeypatch.setattr(client_module, "import_module", import_module_side_effect)
 
-        with (graphql_dir / "resource.yaml").open("w") as f:
-            yaml.dump(graphql_resource_yaml, f)
-        with (http_dir / "resource.yaml").open("w") as f:
-            yaml.dump(http_resource_yaml, f)
+        (graphql_dir / "resource.yaml").write_bytes(graphql_resource_bytes)
+        (http_dir / "resource.yaml").write_bytes(http_resource_bytes)
 
         # Execute
         client = ResourceClient()
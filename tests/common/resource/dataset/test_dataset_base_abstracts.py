@@ -7,6 +7,7 @@ Description
 Cover ``OperationInfo`` auto-population and ``track_result`` decorator behaviour.
 """
 
+import io
 import uuid
 from dataclasses import dataclass
 from enum import StrEnum
@@ -16,15 +17,23 @@ import pandas as pd
 import pytest
 
 from ds_resource_plugin_py_lib.common.resource.dataset.base import (
+    BinaryDataset,
     DatasetSettings,
     TabularDataset,
 )
+from ds_resource_plugin_py_lib.common.resource.dataset.decorators import track_result
 from ds_resource_plugin_py_lib.common.resource.dataset.enums import DatasetMethod
-from ds_resource_plugin_py_lib.common.resource.dataset.result import OperationInfo
+from ds_resource_plugin_py_lib.common.resource.dataset.errors import ReadError
+from ds_resource_plugin_py_lib.common.resource.dataset.result import OperationError, OperationInfo
 from ds_resource_plugin_py_lib.common.resource.linked_service.base import LinkedService, LinkedServiceSettings
 from ds_resource_plugin_py_lib.common.serde.deserialize.base import DataDeserializer
 from ds_resource_plugin_py_lib.common.serde.serialize.base import DataSerializer
 
+# Built once per module; the datasets below only ever read or copy these frames.
+_READ_FRAME = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+_LIST_FRAME = pd.DataFrame({"resource": ["table_a", "table_b"]})
+_ID_FRAME = pd.DataFrame({"id": [1, 2]})
+
 
 @dataclass(kw_only=True)
 class _DummyLinkedServiceSettings(LinkedServiceSettings):
@@ -53,12 +62,21 @@ class _DummyLinkedService(LinkedService[_DummyLinkedServiceSettings]):
         pass
 
 
+# Read-only across tests: no test mutates the linked service a dataset holds.
+_SHARED_LINKED_SERVICE = _DummyLinkedService(
+    id=uuid.uuid4(),
+    name="ls",
+    version="1.0.0",
+    settings=_DummyLinkedServiceSettings(),
+)
+
+
 @dataclass(kw_only=True)
 class _DummyDatasetSettings(DatasetSettings):
     pass
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, eq=False, repr=False)
 class _ConcreteDataset(TabularDataset[_DummyLinkedService, _DummyDatasetSettings, DataSerializer, DataDeserializer]):
     settings: _DummyDatasetSettings
     linked_service: _DummyLinkedService
@@ -74,7 +92,7 @@ class _ConcreteDataset(TabularDataset[_DummyLinkedService, _DummyDatasetSettings
         self.output = self.input.copy()
 
     def read(self) -> None:
-        self.output = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+        self.output = _READ_FRAME
 
     def update(self) -> None:
         self.output = self.input.copy()
@@ -89,7 +107,7 @@ class _ConcreteDataset(TabularDataset[_DummyLinkedService, _DummyDatasetSettings
         pass
 
     def list(self) -> None:
-        self.output = pd.DataFrame({"resource": ["table_a", "table_b"]})
+        self.output = _LIST_FRAME
 
     def rename(self) -> None:
         pass
@@ -98,18 +116,50 @@ class _ConcreteDataset(TabularDataset[_DummyLinkedService, _DummyDatasetSettings
         pass
 
 
-def _make_concrete() -> _ConcreteDataset:
-    return _ConcreteDataset(
+@dataclass(kw_only=True, eq=False, repr=False)
+class _ConcreteBinaryDataset(BinaryDataset[_DummyLinkedService, _DummyDatasetSettings, DataSerializer, DataDeserializer]):
+    settings: _DummyDatasetSettings
+    linked_service: _DummyLinkedService
+
+    @property
+    def type(self) -> StrEnum:  # type: ignore[override]
+        raise NotImplementedError
+
+    def create(self) -> None:
+        pass
+
+    def read(self) -> None:
+        self.output.write(b"payload")
+
+    def update(self) -> None:
+        pass
+
+    def upsert(self) -> None:
+        pass
+
+    def delete(self) -> None:
+        pass
+
+    def purge(self) -> None:
+        pass
+
+    def list(self) -> None:
+        pass
+
+    def rename(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def _make_concrete(cls: type[_ConcreteDataset] = _ConcreteDataset, name: str = "concrete") -> _ConcreteDataset:
+    return cls(
         id=uuid.uuid4(),
-        name="concrete",
+        name=name,
         version="1.0.0",
         settings=_DummyDatasetSettings(),
-        linked_service=_DummyLinkedService(
-            id=uuid.uuid4(),
-            name="ls",
-            version="1.0.0",
-            settings=_DummyLinkedServiceSettings(),
-        ),
+        linked_service=_SHARED_LINKED_SERVICE,
     )
 
 
@@ -133,7 +183,7 @@ class TestTrackResultDecorator:
 
     def test_row_count_auto_derived(self):
         ds = _make_concrete()
-        ds.input = pd.DataFrame({"id": [1, 2]})
+        ds.input = _ID_FRAME
         ds.create()
 
         assert ds.operation.row_count == 2
@@ -144,35 +194,46 @@ class TestTrackResultDecorator:
 
         assert ds.operation.row_count == 3
 
-    def test_schema_auto_derived_on_read(self):
-        ds = _make_concrete()
-        ds.read()
+    def test_row_count_from_property_backed_output(self):
+        class _PropertyOutputDataset(_ConcreteDataset):
+            @property  # type: ignore[override]
+            def output(self) -> pd.DataFrame:
+                return self.__dict__["_frame"]
 
-        assert ds.operation.schema is not None
-        assert "id" in ds.operation.schema
-        assert "name" in ds.operation.schema
+            @output.setter
+            def output(self, value: pd.DataFrame) -> None:
+                self.__dict__["_frame"] = value
 
-    def test_schema_auto_derived_on_list(self):
-        ds = _make_concrete()
-        ds.list()
-
-        assert ds.operation.schema is not None
-        assert "resource" in ds.operation.schema
+        ds = _make_concrete(_PropertyOutputDataset)
+        ds.read()
 
-    def test_schema_derived_on_write(self):
+        assert ds.operation.row_count == 3
+        assert ds.operation.schema == {"id": "int64", "name": "object"}
+
+    @pytest.mark.parametrize(
+        ("method", "input_frame", "expected_columns"),
+        [
+            ("read", None, ["id", "name"]),
+            ("list", None, ["resource"]),
+            ("create", _ID_FRAME.iloc[:1], ["id"]),
+        ],
+        ids=["read", "list", "create"],
+    )
+    def test_schema_auto_derived(self, method, input_frame, expected_columns):
         ds = _make_concrete()
-        ds.input = pd.DataFrame({"id": [1]})
-        ds.create()
+        if input_frame is not None:
+            ds.input = input_frame
+        getattr(ds, method)()
 
         assert ds.operation.schema is not None
-        assert "id" in ds.operation.schema
+        assert list(ds.operation.schema) == expected_columns
 
     def test_result_reset_on_each_call(self):
         ds = _make_concrete()
         ds.read()
         assert ds.operation.method == DatasetMethod.READ
 
-        ds.input = pd.DataFrame({"id": [1]})
+        ds.input = _ID_FRAME.iloc[:1]
         ds.create()
         assert ds.operation.method == DatasetMethod.CREATE
 
@@ -185,19 +246,8 @@ class TestTrackResultDecorator:
                 self.output = self.input.copy()
                 self.operation.row_count = 999
 
-        ds = _CustomDataset(
-            id=uuid.uuid4(),
-            name="custom",
-            version="1.0.0",
-            settings=_DummyDatasetSettings(),
-            linked_service=_DummyLinkedService(
-                id=uuid.uuid4(),
-                name="ls",
-                version="1.0.0",
-                settings=_DummyLinkedServiceSettings(),
-            ),
-        )
-        ds.input = pd.DataFrame({"id": [1]})
+        ds = _make_concrete(_CustomDataset, name="custom")
+        ds.input = _ID_FRAME.iloc[:1]
         ds.create()
 
         assert ds.operation.row_count == 999
@@ -208,18 +258,7 @@ class TestTrackResultDecorator:
             def create(self) -> None:
                 raise RuntimeError("boom")
 
-        ds = _FailingDataset(
-            id=uuid.uuid4(),
-            name="failing",
-            version="1.0.0",
-            settings=_DummyDatasetSettings(),
-            linked_service=_DummyLinkedService(
-                id=uuid.uuid4(),
-                name="ls",
-                version="1.0.0",
-                settings=_DummyLinkedServiceSettings(),
-            ),
-        )
+        ds = _make_concrete(_FailingDataset, name="failing")
         with pytest.raises(RuntimeError, match="boom"):
             ds.create()
 
@@ -227,3 +266,142 @@ class TestTrackResultDecorator:
         assert ds.operation.started_at is not None
         assert ds.operation.ended_at is not None
         assert ds.operation.duration_ms >= 0
+
+    def test_schema_uses_output_dtypes(self):
+        ds = _make_concrete()
+        ds.read()
+
+        assert ds.operation.schema == {"id": "int64", "name": "object"}
+
+    def test_schema_skipped_when_no_rows(self):
+        ds = _make_concrete()
+        ds.purge()
+
+        assert ds.operation.row_count == 0
+        assert ds.operation.schema is None
+
+    def test_ended_at_matches_duration(self):
+        ds = _make_concrete()
+        ds.read()
+
+        assert ds.operation.started_at is not None
+        assert ds.operation.ended_at is not None
+        elapsed_ms = (ds.operation.ended_at - ds.operation.started_at).total_seconds() * 1000
+        assert elapsed_ms == pytest.approx(ds.operation.duration_ms, abs=0.002)
+
+    def test_unknown_method_name_fails_at_decoration(self):
+        def not_a_dataset_method(self) -> None:
+            pass
+
+        with pytest.raises(ValueError, match="not_a_dataset_method"):
+            track_result(not_a_dataset_method)
+
+    def test_resource_exception_captured_as_operation_error(self):
+        @dataclass(kw_only=True)
+        class _ReadFailingDataset(_ConcreteDataset):
+            def read(self) -> None:
+                raise ReadError(message="no table", details={"table": "t"})
+
+        ds = _make_concrete(_ReadFailingDataset, name="failing")
+        with pytest.raises(ReadError):
+            ds.read()
+
+        assert ds.operation.success is False
+        assert ds.operation.error == OperationError(
+            message="no table",
+            code="DS_DATASET_READ_ERROR",
+            status_code=500,
+            details={"table": "t"},
+        )
+
+    def test_generic_exception_captured_as_operation_error(self):
+        @dataclass(kw_only=True)
+        class _FailingDataset(_ConcreteDataset):
+            def create(self) -> None:
+                raise RuntimeError("boom")
+
+        ds = _make_concrete(_FailingDataset, name="failing")
+        with pytest.raises(RuntimeError):
+            ds.create()
+
+        assert ds.operation.error == OperationError(message="boom", code="RuntimeError", status_code=500)
+
+    def test_tracking_can_be_disabled_per_subclass(self):
+        @dataclass(kw_only=True)
+        class _UntrackedDataset(_ConcreteDataset):
+            _track_operations = False
+
+            def read(self) -> None:
+                self.output = _ID_FRAME.iloc[:1]
+
+        ds = _make_concrete(_UntrackedDataset, name="untracked")
+        ds.read()
+
+        assert ds.operation.method is None
+        assert ds.operation.started_at is None
+
+
+class TestDatasetDunders:
+    def test_repr_is_short(self):
+        ds = _make_concrete()
+        ds.read()
+
+        assert repr(ds) == "_ConcreteDataset(name='concrete', version='1.0.0')"
+
+    def test_eq_is_identity_based(self):
+        ds = _make_concrete()
+        ds.read()
+        other = _make_concrete()
+        other.read()
+
+        assert ds == ds  # noqa: PLR0124
+        assert ds != other
+
+
+class TestBinaryDatasetBuffers:
+    def _make(self, **kwargs: Any) -> _ConcreteBinaryDataset:
+        return _ConcreteBinaryDataset(
+            id=uuid.uuid4(),
+            name="binary",
+            version="1.0.0",
+            settings=_DummyDatasetSettings(),
+            linked_service=_SHARED_LINKED_SERVICE,
+            **kwargs,
+        )
+
+    def test_buffers_allocated_on_first_access(self):
+        ds = self._make()
+
+        assert "_input" not in vars(ds)
+        assert "_output" not in vars(ds)
+
+        ds.read()
+
+        assert ds.output.getvalue() == b"payload"
+        assert ds.output is ds.output
+        assert "_input" not in vars(ds)
+
+    def test_tracking_does_not_allocate_output(self):
+        ds = self._make()
+
+        ds.create()
+
+        assert ds.operation.success is True
+        assert "_output" not in vars(ds)
+
+    def test_assigned_none_is_kept(self):
+        ds = self._make(output=None)
+
+        assert ds.output is None
+
+    def test_assigned_buffer_is_kept(self):
+        buffer = io.BytesIO(b"data")
+        ds = self._make(input=buffer)
+
+        assert ds.input is buffer
+
+    def test_buffers_not_serialized(self):
+        ds = self._make()
+
+        assert "input" not in ds.serialize()
+        assert "output" not in ds.serialize()
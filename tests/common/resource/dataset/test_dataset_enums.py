@@ -0,0 +1,18 @@
+"""
+**File:** ``test_dataset_enums.py``
+**Region:** ``tests/common/resource/dataset``
+
+Description
+-----------
+Tests for `DatasetMethod` helpers.
+"""
+
+from ds_resource_plugin_py_lib.common.resource.dataset.enums import DatasetMethod
+
+
+def test_all_values_covers_every_member():
+    """all_values should return every member value and be reused across calls."""
+    values = DatasetMethod.all_values()
+
+    assert values == {m.value for m in DatasetMethod}
+    assert DatasetMethod.all_values() is values
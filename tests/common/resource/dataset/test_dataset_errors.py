@@ -24,6 +24,7 @@ from ds_resource_plugin_py_lib.common.resource.dataset.errors import (
     UpdateError,
     UpsertError,
 )
+from tests.helpers import assert_exception_defaults
 
 
 @pytest.mark.parametrize(
@@ -46,13 +47,7 @@ from ds_resource_plugin_py_lib.common.resource.dataset.errors import (
 )
 def test_dataset_exception_defaults(exc_cls, expected_code, expected_status, expected_message):
     """Validate default code, status_code, message, and details."""
-    exc = exc_cls()
-
-    assert exc.code == expected_code
-    assert exc.status_code == expected_status
-    assert exc.message == expected_message
-    assert exc.details == {}
-    assert str(exc) == expected_message
+    assert_exception_defaults(exc_cls, expected_code, expected_status, expected_message)
 
 
 def test_dataset_exception_custom_details():
@@ -22,3 +22,15 @@ def test_dataset_info_str_and_key():
 
     assert str(info) == "DS.RESOURCE.DATASET.EXAMPLE:v1.2.3"
     assert info.key == ("DS.RESOURCE.DATASET.EXAMPLE", "1.2.3")
+
+
+def test_dataset_info_is_a_named_tuple():
+    """DatasetInfo should keep the NamedTuple API consumers rely on."""
+    info = DatasetInfo(type="T", name="n", class_name="m.C", version="1.0.0")
+
+    type_, name, class_name, version, description = info
+
+    assert (type_, name, class_name, version, description) == ("T", "n", "m.C", "1.0.0", None)
+    assert info[0] == "T"
+    assert info._asdict()["version"] == "1.0.0"
+    assert info._replace(version="2.0.0").key == ("T", "2.0.0")
@@ -18,64 +18,24 @@ from ds_resource_plugin_py_lib.common.resource.linked_service.errors import (
     LinkedServiceException,
     UnsupportedLinkedServiceTypeError,
 )
+from tests.helpers import assert_exception_defaults
 
 
 @pytest.mark.parametrize(
-    ("exc_cls", "expected_code", "expected_message", "expected_status"),
+    ("exc_cls", "expected_code", "expected_status", "expected_message"),
     [
-        (
-            LinkedServiceException,
-            "DS_LINKED_SERVICE_ERROR",
-            "Linked service operation failed",
-            500,
-        ),
-        (
-            UnsupportedLinkedServiceTypeError,
-            "DS_LINKED_SERVICE_UNSUPPORTED_TYPE_ERROR",
-            "Unsupported linked service type",
-            400,
-        ),
-        (
-            InvalidLinkedServiceTypeError,
-            "DS_LINKED_SERVICE_INVALID_TYPE_ERROR",
-            "Invalid linked service type",
-            400,
-        ),
-        (
-            InvalidLinkedServiceClassError,
-            "DS_LINKED_SERVICE_INVALID_CLASS_ERROR",
-            "Invalid linked service class",
-            400,
-        ),
-        (
-            AuthenticationError,
-            "DS_LINKED_SERVICE_AUTHENTICATION_ERROR",
-            "Authentication failed",
-            401,
-        ),
-        (
-            ConnectionError,
-            "DS_LINKED_SERVICE_CONNECTION_ERROR",
-            "Connection failed",
-            503,
-        ),
-        (
-            AuthorizationError,
-            "DS_LINKED_SERVICE_AUTHORIZATION_ERROR",
-            "Authorization failed",
-            403,
-        ),
+        (LinkedServiceException, "DS_LINKED_SERVICE_ERROR", 500, "Linked service operation failed"),
+        (UnsupportedLinkedServiceTypeError, "DS_LINKED_SERVICE_UNSUPPORTED_TYPE_ERROR", 400, "Unsupported linked service type"),
+        (InvalidLinkedServiceTypeError, "DS_LINKED_SERVICE_INVALID_TYPE_ERROR", 400, "Invalid linked service type"),
+        (InvalidLinkedServiceClassError, "DS_LINKED_SERVICE_INVALID_CLASS_ERROR", 400, "Invalid linked service class"),
+        (AuthenticationError, "DS_LINKED_SERVICE_AUTHENTICATION_ERROR", 401, "Authentication failed"),
+        (ConnectionError, "DS_LINKED_SERVICE_CONNECTION_ERROR", 503, "Connection failed"),
+        (AuthorizationError, "DS_LINKED_SERVICE_AUTHORIZATION_ERROR", 403, "Authorization failed"),
     ],
 )
-def test_linked_service_exception_defaults(exc_cls, expected_code, expected_message, expected_status):
-    """Validate current default code/message wiring and details."""
-    exc = exc_cls()
-
-    assert exc.code == expected_code
-    assert exc.status_code == expected_status
-    assert exc.message == expected_message
-    assert exc.details == {}
-    assert str(exc) == expected_message
+def test_linked_service_exception_defaults(exc_cls, expected_code, expected_status, expected_message):
+    """Validate default code, status_code, message, and details."""
+    assert_exception_defaults(exc_cls, expected_code, expected_status, expected_message)
 
 
 def test_linked_service_exception_custom_details():
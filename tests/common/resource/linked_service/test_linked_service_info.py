@@ -22,3 +22,15 @@ def test_linked_service_info_str_and_key():
 
     assert str(info) == "DS.RESOURCE.LINKED_SERVICE.EXAMPLE:v2.0.0"
     assert info.key == ("DS.RESOURCE.LINKED_SERVICE.EXAMPLE", "2.0.0")
+
+
+def test_linked_service_info_is_a_named_tuple():
+    """LinkedServiceInfo should keep the NamedTuple API consumers rely on."""
+    info = LinkedServiceInfo(type="T", name="n", class_name="m.C", version="1.0.0")
+
+    type_, name, class_name, version, description = info
+
+    assert (type_, name, class_name, version, description) == ("T", "n", "m.C", "1.0.0", None)
+    assert info[0] == "T"
+    assert info._asdict()["version"] == "1.0.0"
+    assert info._replace(version="2.0.0").key == ("T", "2.0.0")
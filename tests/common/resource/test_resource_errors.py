@@ -14,6 +14,7 @@ from ds_resource_plugin_py_lib.common.resource.errors import (
     ResourceException,
     ValidationError,
 )
+from tests.helpers import assert_exception_defaults
 
 
 @pytest.mark.parametrize(
@@ -26,13 +27,7 @@ from ds_resource_plugin_py_lib.common.resource.errors import (
 )
 def test_resource_exception_defaults(exc_cls, expected_code, expected_status, expected_message):
     """Validate default code, status_code, message, and details."""
-    exc = exc_cls()
-
-    assert exc.code == expected_code
-    assert exc.status_code == expected_status
-    assert exc.message == expected_message
-    assert exc.details == {}
-    assert str(exc) == expected_message
+    assert_exception_defaults(exc_cls, expected_code, expected_status, expected_message)
 
 
 def test_resource_exception_custom_details():
@@ -7,9 +7,9 @@ Description
 Tests for `AwsWranglerDeserializer` covering supported formats and validation.
 """
 
-import json
+from types import SimpleNamespace
 from typing import cast
-from unittest.mock import ANY, patch
+from unittest.mock import ANY, Mock
 
 import pandas as pd
 import pytest
@@ -17,8 +17,21 @@ from ds_common_serde_py_lib.errors import DeserializationError
 from pandas.testing import assert_frame_equal
 
 from ds_resource_plugin_py_lib.common.resource.dataset.storage_format import DatasetStorageFormatType
+from ds_resource_plugin_py_lib.common.serde.deserialize import awswrangler as awswrangler_module
 from ds_resource_plugin_py_lib.common.serde.deserialize.awswrangler import AwsWranglerDeserializer
 
+_BAD_FORMAT = cast("DatasetStorageFormatType", "OTHER")
+_XML_PAYLOAD = b"<root><row><id>1</id></row></root>"
+_BINARY_PAYLOAD = b"binary-payload"
+
+
+@pytest.fixture
+def wr_s3(monkeypatch):
+    """Replace the deserializer's `wr.s3` with fresh mocks in a single module attribute swap."""
+    s3 = SimpleNamespace(read_csv=Mock(), read_parquet=Mock(), read_json=Mock(), read_excel=Mock(), download=Mock())
+    monkeypatch.setattr(awswrangler_module, "wr", SimpleNamespace(s3=s3))
+    return s3
+
 
 class TestAwsWranglerDeserializer:
     """Validate AwsWranglerDeserializer for all supported formats."""
@@ -29,77 +42,55 @@ class TestAwsWranglerDeserializer:
             (DatasetStorageFormatType.CSV, "read_csv"),
             (DatasetStorageFormatType.PARQUET, "read_parquet"),
             (DatasetStorageFormatType.JSON, "read_json"),
+            (DatasetStorageFormatType.EXCEL, "read_excel"),
         ],
     )
-    def test_tabular_formats(self, format_type, method_name, sample_dataframe, boto3_session):
+    def test_tabular_formats(self, format_type, method_name, sample_dataframe, boto3_session, wr_s3):
         """Ensure tabular formats delegate to awswrangler.s3 readers."""
         path = "s3://bucket/key"
-        target = f"ds_resource_plugin_py_lib.common.serde.deserialize.awswrangler.wr.s3.{method_name}"
-        with patch(target, return_value=sample_dataframe) as mock_reader:
-            deserializer = AwsWranglerDeserializer(format=format_type)
+        mock_reader = getattr(wr_s3, method_name)
+        mock_reader.return_value = sample_dataframe
+        deserializer = AwsWranglerDeserializer(format=format_type)
 
-            result = deserializer(path, boto3_session=boto3_session)
+        result = deserializer(path, boto3_session=boto3_session)
 
-            assert_frame_equal(result, sample_dataframe)
-            mock_reader.assert_called_once_with(path=path, boto3_session=boto3_session)
+        assert result is sample_dataframe
+        mock_reader.assert_called_once_with(path=path, boto3_session=boto3_session)
 
-    def test_semi_structured_json(self, semi_structured_json, boto3_session):
+    def test_semi_structured_json(self, semi_structured_json_bytes, semi_structured_expected, boto3_session, wr_s3):
         """Download semi-structured JSON and normalize it."""
         path = "s3://bucket/structured.json"
-        json_bytes = json.dumps(semi_structured_json).encode("utf-8")
 
         def fake_download(path, boto3_session, local_file):
-            local_file.write(json_bytes)
+            local_file.write(semi_structured_json_bytes)
             local_file.seek(0)
 
-        with patch(
-            "ds_resource_plugin_py_lib.common.serde.deserialize.awswrangler.wr.s3.download", side_effect=fake_download
-        ) as mock_download:
-            deserializer = AwsWranglerDeserializer(format=DatasetStorageFormatType.SEMI_STRUCTURED_JSON)
-
-            result = deserializer(path, boto3_session=boto3_session)
-
-            expected = pd.json_normalize(semi_structured_json)
-            assert_frame_equal(result, expected)
-            mock_download.assert_called_once_with(path=path, boto3_session=boto3_session, local_file=ANY)
-
-    def test_excel_format(self, sample_dataframe, boto3_session):
-        """Delegate EXCEL to awswrangler.s3.read_excel."""
-        path = "s3://bucket/workbook.xlsx"
-        with patch(
-            "ds_resource_plugin_py_lib.common.serde.deserialize.awswrangler.wr.s3.read_excel", return_value=sample_dataframe
-        ) as mock_read:
-            deserializer = AwsWranglerDeserializer(format=DatasetStorageFormatType.EXCEL)
+        wr_s3.download.side_effect = fake_download
+        deserializer = AwsWranglerDeserializer(format=DatasetStorageFormatType.SEMI_STRUCTURED_JSON)
 
-            result = deserializer(path, boto3_session=boto3_session)
+        result = deserializer(path, boto3_session=boto3_session)
 
-            assert_frame_equal(result, sample_dataframe)
-            mock_read.assert_called_once_with(path=path, boto3_session=boto3_session)
+        assert_frame_equal(result, semi_structured_expected)
+        wr_s3.download.assert_called_once_with(path=path, boto3_session=boto3_session, local_file=ANY)
 
-    def test_xml_format(self, sample_dataframe, boto3_session):
+    def test_xml_format(self, monkeypatch, sample_dataframe, boto3_session, wr_s3):
         """Download XML and parse through pandas.read_xml."""
         path = "s3://bucket/data.xml"
-        xml_payload = b"<root><row><id>1</id></row></root>"
 
         def fake_download(path, boto3_session, local_file):
-            local_file.write(xml_payload)
+            local_file.write(_XML_PAYLOAD)
             local_file.seek(0)
 
-        with (
-            patch(
-                "ds_resource_plugin_py_lib.common.serde.deserialize.awswrangler.wr.s3.download", side_effect=fake_download
-            ) as mock_download,
-            patch(
-                "ds_resource_plugin_py_lib.common.serde.deserialize.awswrangler.pd.read_xml", return_value=sample_dataframe
-            ) as mock_read_xml,
-        ):
-            deserializer = AwsWranglerDeserializer(format=DatasetStorageFormatType.XML)
+        wr_s3.download.side_effect = fake_download
+        mock_read_xml = Mock(return_value=sample_dataframe)
+        monkeypatch.setattr(awswrangler_module.pd, "read_xml", mock_read_xml)
+        deserializer = AwsWranglerDeserializer(format=DatasetStorageFormatType.XML)
 
-            result = deserializer(path, boto3_session=boto3_session)
+        result = deserializer(path, boto3_session=boto3_session)
 
-            assert_frame_equal(result, sample_dataframe)
-            mock_download.assert_called_once_with(path=path, boto3_session=boto3_session, local_file=ANY)
-            mock_read_xml.assert_called_once()
+        assert result is sample_dataframe
+        wr_s3.download.assert_called_once_with(path=path, boto3_session=boto3_session, local_file=ANY)
+        mock_read_xml.assert_called_once()
 
     def test_missing_boto3_session_raises(self):
         """Require boto3_session for all reads."""
@@ -110,30 +101,26 @@ class TestAwsWranglerDeserializer:
 
     def test_unsupported_format_raises(self, boto3_session):
         """Raise DeserializationError for unsupported formats."""
-        bad_format = cast("DatasetStorageFormatType", "OTHER")
-        deserializer = AwsWranglerDeserializer(format=bad_format)
+        deserializer = AwsWranglerDeserializer(format=_BAD_FORMAT)
 
         with pytest.raises(DeserializationError, match="Unsupported format"):
             deserializer("s3://bucket/key", boto3_session=boto3_session)
 
-    def test_binary_format(self, boto3_session):
+    def test_binary_format(self, boto3_session, wr_s3):
         """Download binary and wrap it in a single-row DataFrame."""
         path = "s3://bucket/data.bin"
-        payload = b"binary-payload"
 
         def fake_download(path, boto3_session, local_file):
-            local_file.write(payload)
+            local_file.write(_BINARY_PAYLOAD)
             local_file.seek(0)
 
-        with patch(
-            "ds_resource_plugin_py_lib.common.serde.deserialize.awswrangler.wr.s3.download", side_effect=fake_download
-        ) as mock_download:
-            deserializer = AwsWranglerDeserializer(
-                format=DatasetStorageFormatType.BINARY,
-                kwargs={"column": "content"},
-            )
+        wr_s3.download.side_effect = fake_download
+        deserializer = AwsWranglerDeserializer(
+            format=DatasetStorageFormatType.BINARY,
+            kwargs={"column": "content"},
+        )
 
-            result = deserializer(path, boto3_session=boto3_session)
+        result = deserializer(path, boto3_session=boto3_session)
 
-            assert_frame_equal(result, pd.DataFrame({"content": [payload]}))
-            mock_download.assert_called_once_with(path=path, boto3_session=boto3_session, local_file=ANY)
+        assert_frame_equal(result, pd.DataFrame({"content": [_BINARY_PAYLOAD]}))
+        wr_s3.download.assert_called_once_with(path=path, boto3_session=boto3_session, local_file=ANY)
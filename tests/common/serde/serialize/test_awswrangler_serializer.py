@@ -7,16 +7,28 @@ Description
 Tests for `AwsWranglerSerializer` covering supported formats and validation.
 """
 
+from types import SimpleNamespace
 from typing import cast
-from unittest.mock import patch
+from unittest.mock import Mock
 
 import pandas as pd
 import pytest
 from ds_common_serde_py_lib.errors import SerializationError
 
 from ds_resource_plugin_py_lib.common.resource.dataset.storage_format import DatasetStorageFormatType
+from ds_resource_plugin_py_lib.common.serde.serialize import awswrangler as awswrangler_module
 from ds_resource_plugin_py_lib.common.serde.serialize.awswrangler import AwsWranglerSerializer
 
+_BAD_FORMAT = cast("DatasetStorageFormatType", "OTHER")
+
+
+@pytest.fixture
+def wr_s3(monkeypatch):
+    """Replace the serializer's `wr.s3` with fresh mocks in a single module attribute swap."""
+    s3 = SimpleNamespace(to_csv=Mock(), to_parquet=Mock(), to_json=Mock(), to_excel=Mock(), upload=Mock())
+    monkeypatch.setattr(awswrangler_module, "wr", SimpleNamespace(s3=s3))
+    return s3
+
 
 class TestAwsWranglerSerializer:
     """Validate AwsWranglerSerializer across supported formats."""
@@ -30,36 +42,30 @@ class TestAwsWranglerSerializer:
             (DatasetStorageFormatType.EXCEL, "to_excel"),
         ],
     )
-    def test_tabular_formats(self, format_type, method_name, sample_dataframe, boto3_session):
+    def test_tabular_formats(self, format_type, method_name, sample_dataframe, boto3_session, wr_s3):
         """Ensure DataFrame is written using awswrangler.s3 helpers."""
-        target = f"ds_resource_plugin_py_lib.common.serde.serialize.awswrangler.wr.s3.{method_name}"
-        with patch(target, return_value="ok") as mock_writer:
-            serializer = AwsWranglerSerializer(format=format_type)
+        mock_writer = getattr(wr_s3, method_name)
+        mock_writer.return_value = "ok"
+        serializer = AwsWranglerSerializer(format=format_type)
 
-            result = serializer(sample_dataframe, boto3_session=boto3_session)
+        result = serializer(sample_dataframe, boto3_session=boto3_session)
 
-            assert result == "ok"
-            mock_writer.assert_called_once_with(sample_dataframe, boto3_session=boto3_session)
+        assert result == "ok"
+        mock_writer.assert_called_once_with(sample_dataframe, boto3_session=boto3_session)
 
-    def test_xml_uploads_string(self, sample_dataframe, boto3_session):
+    def test_xml_uploads_string(self, monkeypatch, sample_dataframe, boto3_session, wr_s3):
         """Convert DataFrame to XML and upload via awswrangler.s3.upload."""
-        target = "ds_resource_plugin_py_lib.common.serde.serialize.awswrangler.wr.s3.upload"
         kwargs = {
             "path": "s3://bucket/data.xml",
         }
-        with (
-            patch(
-                "ds_resource_plugin_py_lib.common.serde.serialize.awswrangler.pd.DataFrame.to_xml",
-                return_value="<data/>",
-            ),
-            patch(target, return_value="uploaded") as mock_upload,
-        ):
-            serializer = AwsWranglerSerializer(format=DatasetStorageFormatType.XML, kwargs=kwargs)
+        monkeypatch.setattr(pd.DataFrame, "to_xml", Mock(return_value="<data/>"))
+        wr_s3.upload.return_value = "uploaded"
+        serializer = AwsWranglerSerializer(format=DatasetStorageFormatType.XML, kwargs=kwargs)
 
-            result = serializer(sample_dataframe, boto3_session=boto3_session)
+        result = serializer(sample_dataframe, boto3_session=boto3_session)
 
-            assert result == "uploaded"
-            mock_upload.assert_called_once()
+        assert result == "uploaded"
+        wr_s3.upload.assert_called_once_with("<data/>", boto3_session=boto3_session, path="s3://bucket/data.xml")
 
     def test_missing_boto3_session_raises(self, sample_dataframe):
         """Require boto3_session for all writes."""
@@ -70,30 +76,29 @@ class TestAwsWranglerSerializer:
 
     def test_unsupported_format_raises(self, sample_dataframe, boto3_session):
         """Raise SerializationError for unsupported formats."""
-        serializer = AwsWranglerSerializer(format=cast("DatasetStorageFormatType", "OTHER"))
+        serializer = AwsWranglerSerializer(format=_BAD_FORMAT)
 
         with pytest.raises(SerializationError):
             serializer(sample_dataframe, boto3_session=boto3_session)
 
-    def test_binary_uploads_bytes(self, boto3_session):
+    def test_binary_uploads_bytes(self, boto3_session, wr_s3):
         """Extract binary from DataFrame and upload via awswrangler.s3.upload."""
         payload = b"binary-payload"
         df = pd.DataFrame({"content": [payload]})
-        target = "ds_resource_plugin_py_lib.common.serde.serialize.awswrangler.wr.s3.upload"
         kwargs = {
             "column": "content",
             "row": 0,
             "path": "s3://bucket/data.bin",
         }
 
-        with patch(target, return_value="uploaded") as mock_upload:
-            serializer = AwsWranglerSerializer(format=DatasetStorageFormatType.BINARY, kwargs=kwargs)
+        wr_s3.upload.return_value = "uploaded"
+        serializer = AwsWranglerSerializer(format=DatasetStorageFormatType.BINARY, kwargs=kwargs)
 
-            result = serializer(df, boto3_session=boto3_session)
+        result = serializer(df, boto3_session=boto3_session)
 
-            assert result == "uploaded"
-            mock_upload.assert_called_once_with(
-                payload,
-                boto3_session=boto3_session,
-                path="s3://bucket/data.bin",
-            )
+        assert result == "uploaded"
+        wr_s3.upload.assert_called_once_with(
+            payload,
+            boto3_session=boto3_session,
+            path="s3://bucket/data.bin",
+        )
@@ -11,9 +11,11 @@ import pytest
 
 from ds_resource_plugin_py_lib.common.serde.serialize.base import DataSerializer
 
+_SENTINEL = object()
+
 
 def test_data_serializer_call_is_not_implemented():
     """Test that the DataSerializer call is not implemented."""
     serializer = DataSerializer()
     with pytest.raises(NotImplementedError):
-        serializer({"any": "object"})
+        serializer(_SENTINEL)
@@ -9,7 +9,7 @@ Tests for `PandasSerializer` covering supported formats and validation.
 
 import io
 from typing import cast
-from unittest.mock import patch
+from unittest.mock import Mock
 
 import pandas as pd
 import pytest
@@ -18,6 +18,8 @@ from ds_common_serde_py_lib.errors import SerializationError
 from ds_resource_plugin_py_lib.common.resource.dataset.storage_format import DatasetStorageFormatType
 from ds_resource_plugin_py_lib.common.serde.serialize.pandas import PandasSerializer
 
+_BAD_FORMAT = cast("DatasetStorageFormatType", "OTHER")
+
 
 class TestPandasSerializer:
     """Validate PandasSerializer behaviors across formats."""
@@ -47,49 +49,47 @@ class TestPandasSerializer:
         loaded = pd.read_json(io.StringIO(json_string))
         assert len(loaded) == len(sample_dataframe)
 
-    def test_excel_uses_default_float_format(self, sample_dataframe):
+    def test_excel_uses_default_float_format(self, monkeypatch, sample_dataframe):
         """Ensure Excel serialization sets float_format when absent."""
         serializer = PandasSerializer(format=DatasetStorageFormatType.EXCEL, kwargs={"float_format": "%.2f"})
+        to_excel = Mock(return_value="excel")
+        monkeypatch.setattr(pd.DataFrame, "to_excel", to_excel)
 
-        with patch(
-            "ds_resource_plugin_py_lib.common.serde.serialize.pandas.pd.DataFrame.to_excel", return_value="excel"
-        ) as to_excel:
-            result = serializer(sample_dataframe, index=False)
+        result = serializer(sample_dataframe, index=False)
 
         assert serializer.kwargs["float_format"] == "%.2f"
         to_excel.assert_called_once()
         assert result == "excel"
 
-    def test_xml_serialization(self, sample_dataframe):
+    def test_xml_serialization(self, monkeypatch, sample_dataframe):
         """Serialize DataFrame to XML."""
         serializer = PandasSerializer(format=DatasetStorageFormatType.XML, kwargs={"index": False})
+        to_xml = Mock(return_value="<data><row><id>1</id></row></data>")
+        monkeypatch.setattr(pd.DataFrame, "to_xml", to_xml)
 
-        with patch(
-            "ds_resource_plugin_py_lib.common.serde.serialize.pandas.pd.DataFrame.to_xml",
-            return_value="<data><row><id>1</id></row></data>",
-        ) as to_xml:
-            xml_output = serializer(sample_dataframe)
+        xml_output = serializer(sample_dataframe)
 
         to_xml.assert_called_once_with(index=False)
         assert "<id>1</id>" in xml_output
 
     def test_unsupported_format_raises(self, sample_dataframe):
         """Raise SerializationError for unsupported format."""
-        serializer = PandasSerializer(format=cast("DatasetStorageFormatType", "OTHER"))
+        serializer = PandasSerializer(format=_BAD_FORMAT)
 
         with pytest.raises(SerializationError):
             serializer(sample_dataframe)
 
-    def test_parquet_serialization(self, sample_dataframe, boto3_session):
+    def test_parquet_serialization(self, monkeypatch, sample_dataframe, boto3_session):
         """Parquet format should call to_parquet."""
         kwargs = {
             "index": False,
         }
         serializer = PandasSerializer(format=DatasetStorageFormatType.PARQUET, kwargs=kwargs)
-        with patch(
-            "ds_resource_plugin_py_lib.common.serde.serialize.pandas.pd.DataFrame.to_parquet", return_value="parquet"
-        ) as to_parquet:
-            result = serializer(sample_dataframe, **kwargs)
+        to_parquet = Mock(return_value="parquet")
+        monkeypatch.setattr(pd.DataFrame, "to_parquet", to_parquet)
+
+        result = serializer(sample_dataframe, **kwargs)
+
         to_parquet.assert_called_once()
         assert result == "parquet"
 
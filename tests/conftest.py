@@ -7,136 +7,160 @@ Description
 Shared pytest fixtures for resource client tests.
 """
 
-import tempfile
+import json
+from collections.abc import Iterator, Mapping
 from pathlib import Path
-from unittest.mock import Mock
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+from unittest.mock import sentinel
 
+import numpy as np
 import pandas as pd
 import pytest
+import yaml
 
-from ds_resource_plugin_py_lib.common.resource.dataset.base import Dataset
-from ds_resource_plugin_py_lib.common.resource.linked_service.base import LinkedService
+from tests.helpers import GRAPHQL_RESOURCE_TEXT
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - LibYAML not available
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for resource.yaml files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+GRAPHQL_RESOURCE_YAML: Mapping[str, Any] = MappingProxyType(yaml.load(GRAPHQL_RESOURCE_TEXT, Loader=_YamlLoader))
+
+SEMI_STRUCTURED_JSON_BYTES = json.dumps(
+    [{"id": 1, "payload": {"nested": True}}, {"id": 2, "payload": {"nested": False}}],
+).encode("utf-8")
 
 
 @pytest.fixture
-def graphql_resource_yaml():
-    """GraphQL resource.yaml content."""
-    return {
-        "package-name": "graphql",
-        "name": "graphql",
-        "description": "GraphQL provider for the DS Business Workflow",
-        "dataset": [
-            {
-                "name": "GRAPHQL",
-                "type": "DS.RESOURCE.DATASET.GRAPHQL",
-                "version": "1.0.0",
-                "description": "GRAPHQL dataset",
-                "class_name": "ds_protocol_graphql_py_lib.dataset.graphql.GraphQLDataset",
-            }
-        ],
-        "linked_service": [
-            {
-                "name": "GRAPHQL",
-                "type": "DS.RESOURCE.LINKED_SERVICE.GRAPHQL",
-                "version": "1.0.0",
-                "description": "GRAPHQL linked service",
-                "class_name": "ds_protocol_graphql_py_lib.linked_service.graphql.GraphQLLinkedService",
-            }
-        ],
-    }
+def temp_dir(tmp_path: Path) -> Path:
+    """Provide a per-test temporary directory for resource.yaml files, managed by pytest's `tmp_path`."""
+    return tmp_path
 
 
-@pytest.fixture
-def http_resource_yaml():
-    """HTTP resource.yaml content with multiple dataset versions."""
-    return {
-        "package-name": "http",
-        "name": "http",
-        "description": "HTTP protocol for the DS Business Workflow",
-        "dataset": [
-            {
-                "name": "HTTP",
-                "type": "DS.RESOURCE.DATASET.HTTP",
-                "version": "1.0.0",
-                "description": "HTTP dataset",
-                "class_name": "ds_protocol_http_py_lib.dataset.http.HttpDataset",
-            },
-            {
-                "name": "HTTP",
-                "type": "DS.RESOURCE.DATASET.HTTP",
-                "version": "2.0.0",
-                "description": "HTTP dataset",
-                "class_name": "ds_protocol_http_py_lib.dataset.httpV2.HttpDataset",
-            },
-        ],
-        "linked_service": [
-            {
-                "name": "HTTP",
-                "type": "DS.RESOURCE.LINKED_SERVICE.HTTP",
-                "version": "1.0.0",
-                "description": "HTTP linked service",
-                "class_name": "ds_protocol_http_py_lib.linked_service.http.HttpLinkedService",
-            }
-        ],
-    }
+@pytest.fixture(scope="session")
+def graphql_resource_yaml():
+    """GraphQL resource.yaml content, parsed once and shared read-only."""
+    return GRAPHQL_RESOURCE_YAML
 
 
 @pytest.fixture
 def mock_entry_point():
     """Create a mock entry point."""
-    ep = Mock()
-    ep.name = "test_protocol"
-    ep.module = "test_module"
-    ep.value = "test_module:TestClass"
-    return ep
+    return SimpleNamespace(name="test_protocol", module="test_module", value="test_module:TestClass")
 
 
 @pytest.fixture
 def mock_module(temp_dir):
     """Create a mock module with __file__ pointing to temp directory."""
-    module = Mock()
-    module.__file__ = str(temp_dir / "__init__.py")
-    return module
+    return SimpleNamespace(__file__=str(temp_dir / "__init__.py"))
+
+
+class _DeserializeStub:
+    """Stand-in for a Dataset/LinkedService class that records `deserialize` calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self.instance = object()
+        self.side_effect: Exception | None = None
+
+    def deserialize(self, config: dict[str, Any]) -> object:
+        self.calls.append(config)
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.instance
 
 
 @pytest.fixture
 def mock_dataset_class():
-    """Create a mock Dataset class with deserialize method."""
-    mock_cls = Mock(spec=Dataset)
-    mock_instance = Mock(spec=Dataset)
-    mock_cls.deserialize = Mock(return_value=mock_instance)
-    return mock_cls
+    """Create a Dataset class stand-in with a recording deserialize method."""
+    return _DeserializeStub()
 
 
 @pytest.fixture
 def mock_linked_service_class():
-    """Create a mock LinkedService class with deserialize method."""
-    mock_cls = Mock(spec=LinkedService)
-    mock_instance = Mock(spec=LinkedService)
-    mock_cls.deserialize = Mock(return_value=mock_instance)
-    return mock_cls
+    """Create a LinkedService class stand-in with a recording deserialize method."""
+    return _DeserializeStub()
 
 
-@pytest.fixture
+def _sample_columns() -> dict[str, np.ndarray]:
+    """Build the column arrays of the small DataFrame shared by serialization and deserialization tests."""
+    return {"id": np.array([1, 2]), "value": np.array([10.5, 20.75])}
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_teardown(item: pytest.Item) -> Iterator[None]:
+    """
+    Fail the test that mutated a session-shared fixture, before the change leaks into later tests.
+
+    Read-only arrays only block cell writes; adding, dropping or renaming columns
+    in place still changes the shared frame, so its shape and content are compared
+    against a fresh copy after every test that used it.
+
+    Runs after the regular teardown so a failed check does not leave the test half torn down.
+
+    Args:
+        item: The test item being torn down.
+
+    Yields:
+        Control to the regular teardown.
+    """
+    yield
+    funcargs = getattr(item, "funcargs", {})
+    if "sample_dataframe" in funcargs:
+        pd.testing.assert_frame_equal(funcargs["sample_dataframe"], pd.DataFrame(_sample_columns()))
+    if "semi_structured_json" in funcargs:
+        assert funcargs["semi_structured_json"] == json.loads(SEMI_STRUCTURED_JSON_BYTES), "semi_structured_json was mutated"
+
+
+@pytest.fixture(scope="session")
 def sample_dataframe():
-    """Provide a small pandas DataFrame for serialization and deserialization tests."""
-    return pd.DataFrame({"id": [1, 2], "value": [10.5, 20.75]})
+    """Provide a small pandas DataFrame for serialization and deserialization tests (shared per session, must not be mutated)."""
+    columns = _sample_columns()
+    for values in columns.values():
+        # Shared across the session: in-place cell writes must fail instead of leaking into other tests.
+        values.flags.writeable = False
+    return pd.DataFrame(columns, copy=False)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_csv_bytes(sample_dataframe):
+    """Provide `sample_dataframe` encoded as CSV bytes, built once per session."""
+    return sample_dataframe.to_csv(index=False).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def sample_json_text(sample_dataframe):
+    """Provide `sample_dataframe` encoded as a JSON records string, built once per session."""
+    return sample_dataframe.to_json(orient="records")
+
+
+@pytest.fixture(scope="session")
 def boto3_session():
-    """Provide a lightweight mock boto3 session object."""
-    return Mock(name="boto3_session")
+    """Provide an opaque stand-in for a boto3 session; tests only pass it through to mocked AWS calls."""
+    return sentinel.boto3_session
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def semi_structured_json():
-    """Provide nested JSON data for semi-structured deserialization tests."""
-    return [{"id": 1, "payload": {"nested": True}}, {"id": 2, "payload": {"nested": False}}]
+    """Provide nested JSON data for semi-structured deserialization tests (shared per session, must not be mutated)."""
+    return json.loads(SEMI_STRUCTURED_JSON_BYTES)
+
+
+@pytest.fixture(scope="session")
+def semi_structured_json_bytes():
+    """Provide the semi-structured JSON data as UTF-8 bytes, encoded once at import."""
+    return SEMI_STRUCTURED_JSON_BYTES
+
+
+@pytest.fixture(scope="session")
+def semi_structured_json_text():
+    """Provide the semi-structured JSON data as a JSON string."""
+    return SEMI_STRUCTURED_JSON_BYTES.decode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def semi_structured_expected(semi_structured_json):
+    """Provide the normalized DataFrame expected from the semi-structured JSON data, built once per session."""
+    return pd.json_normalize(semi_structured_json)
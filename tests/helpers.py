@@ -0,0 +1,70 @@
+"""
+**File:** ``helpers.py``
+**Region:** ``tests``
+
+Description
+-----------
+Plain constants and assertion helpers shared across test modules.
+"""
+
+from typing import Any
+
+GRAPHQL_RESOURCE_TEXT = """\
+package-name: graphql
+name: graphql
+description: GraphQL provider for the DS Business Workflow
+dataset:
+  - name: GRAPHQL
+    type: DS.RESOURCE.DATASET.GRAPHQL
+    version: 1.0.0
+    description: GRAPHQL dataset
+    class_name: ds_protocol_graphql_py_lib.dataset.graphql.GraphQLDataset
+linked_service:
+  - name: GRAPHQL
+    type: DS.RESOURCE.LINKED_SERVICE.GRAPHQL
+    version: 1.0.0
+    description: GRAPHQL linked service
+    class_name: ds_protocol_graphql_py_lib.linked_service.graphql.GraphQLLinkedService
+"""
+
+HTTP_RESOURCE_TEXT = """\
+package-name: http
+name: http
+description: HTTP protocol for the DS Business Workflow
+dataset:
+  - name: HTTP
+    type: DS.RESOURCE.DATASET.HTTP
+    version: 1.0.0
+    description: HTTP dataset
+    class_name: ds_protocol_http_py_lib.dataset.http.HttpDataset
+  - name: HTTP
+    type: DS.RESOURCE.DATASET.HTTP
+    version: 2.0.0
+    description: HTTP dataset
+    class_name: ds_protocol_http_py_lib.dataset.httpV2.HttpDataset
+linked_service:
+  - name: HTTP
+    type: DS.RESOURCE.LINKED_SERVICE.HTTP
+    version: 1.0.0
+    description: HTTP linked service
+    class_name: ds_protocol_http_py_lib.linked_service.http.HttpLinkedService
+"""
+
+
+def assert_exception_defaults(exc_cls: type[Exception], code: str, status_code: int, message: str) -> None:
+    """
+    Assert that an exception class built without arguments carries the given defaults.
+
+    Args:
+        exc_cls: The exception class to instantiate.
+        code: The expected machine-readable code.
+        status_code: The expected status code.
+        message: The expected message, also used as ``str(exc)``.
+    """
+    exc: Any = exc_cls()
+
+    assert exc.code == code
+    assert exc.status_code == status_code
+    assert exc.message == message
+    assert exc.details == {}
+    assert str(exc) == message
@@ -15,6 +15,14 @@ import pytest
 from ds_resource_plugin_py_lib.libs.utils.import_string import import_string
 
 
+@pytest.fixture(autouse=True)
+def _clear_import_cache():
+    """Keep memoised lookups from leaking between tests."""
+    import_string.cache_clear()
+    yield
+    import_string.cache_clear()
+
+
 def test_import_string_success():
     """Import attribute from dynamically created module."""
     module = types.ModuleType("dummy.module")
@@ -39,3 +47,29 @@ def test_import_string_missing_attribute():
 
     with pytest.raises(ImportError):
         import_string("dummy.missing.DoesNotExist")
+
+
+def test_import_string_is_cached(monkeypatch):
+    """Repeated lookups of the same path are served from the cache."""
+    module = types.ModuleType("dummy.cached")
+    module.Sample = object
+    monkeypatch.setitem(sys.modules, "dummy.cached", module)
+    first = import_string("dummy.cached.Sample")
+
+    monkeypatch.delitem(sys.modules, "dummy.cached")
+
+    assert import_string("dummy.cached.Sample") is first
+    assert import_string.cache_info().hits == 1
+
+
+def test_import_string_failure_not_cached(monkeypatch):
+    """A failed lookup is retried once the attribute becomes available."""
+    module = types.ModuleType("dummy.later")
+    monkeypatch.setitem(sys.modules, "dummy.later", module)
+
+    with pytest.raises(ImportError):
+        import_string("dummy.later.Sample")
+
+    module.Sample = object
+
+    assert import_string("dummy.later.Sample") is object
@@ -10,6 +10,9 @@ Smoke tests ensuring the package can be imported for coverage.
 from __future__ import annotations
 
 import importlib
+from importlib.metadata import PackageNotFoundError
+
+import pytest
 
 
 def test_import_package_and_version_is_string() -> None:
@@ -24,3 +27,36 @@ def test_import_package_and_version_is_string() -> None:
 
     assert isinstance(pkg.__version__, str)
     assert pkg.__version__ != ""
+
+
+def test_version_falls_back_when_distribution_missing(monkeypatch) -> None:
+    """
+    Verify a missing distribution yields the placeholder version.
+
+    Returns:
+        None.
+    """
+    pkg = importlib.import_module("ds_resource_plugin_py_lib")
+
+    def _missing(_name: str) -> str:
+        raise PackageNotFoundError(_name)
+
+    pkg._read_version.cache_clear()
+    monkeypatch.setattr(pkg, "version", _missing)
+    try:
+        assert pkg.__version__ == "0.0.0"
+    finally:
+        pkg._read_version.cache_clear()
+
+
+def test_unknown_attribute_raises() -> None:
+    """
+    Verify unknown module attributes still raise ``AttributeError``.
+
+    Returns:
+        None.
+    """
+    pkg = importlib.import_module("ds_resource_plugin_py_lib")
+
+    with pytest.raises(AttributeError):
+        _ = pkg.does_not_exist